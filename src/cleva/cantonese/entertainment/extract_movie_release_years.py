@@ -35,9 +35,10 @@ def extract_movie_data(jsonld_file_path):
         # Find the main movie entity in the @graph
         movie_entity = None
         movie_qid = os.path.basename(jsonld_file_path).replace('.jsonld', '')
+        movie_ref = f'wd:{movie_qid}'
         
         for item in data.get('@graph', []):
-            if item.get('@id') == f'wd:{movie_qid}' and 'P577' in item:
+            if item.get('@id') == movie_ref and 'P577' in item:
                 movie_entity = item
                 break
         
@@ -70,7 +71,7 @@ def extract_movie_data(jsonld_file_path):
         # If no P1476 English title, look for labels in the graph
         if not english_title:
             for item in data.get('@graph', []):
-                if item.get('@id') == f'wd:{movie_qid}' and 'label' in item:
+                if item.get('@id') == movie_ref and 'label' in item:
                     labels = item.get('label', [])
                     if isinstance(labels, list):
                         for label in labels:
@@ -88,7 +89,7 @@ def extract_movie_data(jsonld_file_path):
         
         # Look for labels in all items in the graph
         for item in data.get('@graph', []):
-            if item.get('@id') == f'wd:{movie_qid}' and 'label' in item:
+            if item.get('@id') == movie_ref and 'label' in item:
                 labels = item.get('label', [])
                 if isinstance(labels, list):
                     for label in labels:
@@ -8,15 +8,21 @@ on the detailed statement objects rather than the simplified P54 property.
 Outputs structured data for all players to support Cantonese benchmark construction.
 """
 
-import json
 import os
 import csv
-from typing import List, Dict, Any, Optional, Tuple
+import hashlib
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 from datetime import datetime
 import sys
+import heapq
+import pickle
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 from cleva.cantonese.utils.jsonld_reader import (
-    extract_entity_names,
+    add_to_index,
+    extract_entity_names_from_index,
+    index_graph_by_id,
     load_jsonld_file
 )
 from cleva.cantonese.utils.cantonese_utils import (
@@ -26,36 +32,103 @@ from cleva.cantonese.utils.cantonese_utils import (
     get_entity_names_from_cache
 )
 from cleva.cantonese.utils.date_utils import parse_date
-from cleva.cantonese.utils.file_utils import extract_player_id_from_filename
+from cleva.cantonese.utils import cantonese_utils, date_utils, file_utils, jsonld_reader
+from cleva.cantonese.utils.file_utils import extract_player_id_from_filename, write_json
 from cleva.cantonese.utils.path_utils import (
     get_football_players_triples_dir,
     get_cantonese_mapping_dir,
     get_soccer_intermediate_dir
 )
 
+# Year used as the end of any membership that is still ongoing
+CURRENT_YEAR = 2025
 
-def teams_overlap(team1_info, team2_info):
-    """Check if two team memberships overlap in time."""
-    start1 = parse_date(team1_info.get('start_date'))
-    end1 = parse_date(team1_info.get('end_date'))
-    start2 = parse_date(team2_info.get('start_date'))
-    end2 = parse_date(team2_info.get('end_date'))
+
+def _years_overlap(start1: Optional[int], end1: Optional[int],
+                   start2: Optional[int], end2: Optional[int]) -> bool:
+    """
+    Check if two memberships given as years overlap in time.
     
-    # If any date is missing, we can't determine overlap
-    if not all([start1, start2]):
+    A missing start year means the overlap can't be determined (False);
+    a missing end year means the membership is ongoing.
+    """
+    if not start1 or not start2:
         return False
     
-    # If either club is current (no end date), use current year
-    current_year = 2025
     if end1 is None:
-        end1 = current_year
+        end1 = CURRENT_YEAR
     if end2 is None:
-        end2 = current_year
+        end2 = CURRENT_YEAR
     
-    # Check if time periods overlap
     return not (end1 < start2 or end2 < start1)
 
 
+def teams_overlap(team1_info, team2_info):
+    """Check if two team memberships overlap in time."""
+    return _years_overlap(
+        parse_date(team1_info.get('start_date')),
+        parse_date(team1_info.get('end_date')),
+        parse_date(team2_info.get('start_date')),
+        parse_date(team2_info.get('end_date'))
+    )
+
+
+def _overlapping_pairs(starts: List[Optional[int]], ends: List[int]) -> List[Tuple[int, int]]:
+    """
+    Find all index pairs (i, j) with i < j whose membership years overlap.
+    
+    Memberships are swept in start-year order while a min-heap on end year
+    holds the ones still active, so each membership is only compared with
+    those it can overlap instead of with every other one at the team.
+    
+    Args:
+        starts: Start year of each membership, None if unknown (never overlaps)
+        ends: End year of each membership, CURRENT_YEAR for ongoing ones
+        
+    Returns:
+        List of (i, j) index pairs in the same order as a nested i < j loop
+    """
+    order = sorted((i for i in range(len(starts)) if starts[i] is not None), key=starts.__getitem__)
+    pairs = []
+    active = []  # heap of (end_year, index) for memberships started so far
+    for j in order:
+        start2 = starts[j]
+        end2 = ends[j]
+        # Anything that ended before this start cannot overlap it or any later one
+        while active and active[0][0] < start2:
+            heapq.heappop(active)
+        for _, i in active:
+            # Everything active started no later than start2; the end check
+            # only matters for memberships whose end precedes their start
+            if starts[i] <= end2:
+                pairs.append((i, j) if i < j else (j, i))
+        heapq.heappush(active, (end2, j))
+    pairs.sort()
+    return pairs
+
+
+def _team_category(name: str, description: str) -> str:
+    """
+    Classify a team as 'youth', 'national_team' or 'club' from its English name and description.
+    Youth keywords take precedence over 'national'.
+    """
+    description = description.lower()
+    
+    # Check for youth teams first; plain substring tests beat any() over a
+    # keyword list and the name is only lowercased when it is needed
+    if 'under-' in description or 'youth' in description or 'u-' in description:
+        return 'youth'
+    
+    name = name.lower()
+    if 'under-' in name or 'u-' in name or 'youth' in name:
+        return 'youth'
+    # Check for national teams
+    if 'national' in description or 'national' in name:
+        return 'national_team'
+    # Everything else is considered a club
+    return 'club'
+
+
 def categorize_teams(all_affiliations):
     """
     Categorize team affiliations into clubs, national teams, and youth teams.
@@ -66,24 +139,32 @@ def categorize_teams(all_affiliations):
     youth_teams = []
     
     for team in all_affiliations:
-        description = team.get('description', '').lower()
-        name = team.get('name', '').lower()
-        
-        # Check for youth teams first
-        if any(keyword in description for keyword in ['under-', 'youth', 'u-']):
-            youth_teams.append(team)
-        elif any(keyword in name for keyword in ['under-', 'u-', 'youth']):
-            youth_teams.append(team)
-        # Check for national teams
-        elif 'national' in description or 'national' in name:
+        category = _team_category(team.get('name', ''), team.get('description', ''))
+        if category == 'club':
+            clubs.append(team)
+        elif category == 'national_team':
             national_teams.append(team)
-        # Everything else is considered a club
         else:
-            clubs.append(team)
+            youth_teams.append(team)
     
     return clubs, national_teams, youth_teams
 
 
+def _split_current(teams):
+    """
+    Split team affiliations into current and former in a single pass.
+    Returns tuple of (current, former), each preserving the input order.
+    """
+    current = []
+    former = []
+    for team in teams:
+        if team['is_current']:
+            current.append(team)
+        else:
+            former.append(team)
+    return current, former
+
+
 def extract_all_teams(jsonld_file_path: str, cached_players: Dict = None, cached_teams: Dict = None) -> Dict[str, Any]:
     """
     Extract ALL team information for a football player from WikiData JSONLD.
@@ -97,9 +178,25 @@ def extract_all_teams(jsonld_file_path: str, cached_players: Dict = None, cached
     Returns:
         Dictionary containing complete player and team information with Cantonese names
     """
-    with open(jsonld_file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_jsonld_file(jsonld_file_path)
+    return extract_all_teams_from_data(data, jsonld_file_path, cached_players, cached_teams)
+
+
+def extract_all_teams_from_data(data: dict, jsonld_file_path: str, cached_players: Dict = None,
+                                cached_teams: Dict = None) -> Dict[str, Any]:
+    """
+    Extract ALL team information for a football player from already parsed WikiData JSONLD.
     
+    Args:
+        data: The parsed JSON-LD data of the player
+        jsonld_file_path: Path (or name) of the player's JSONLD file; the player ID
+            is taken from its 'Q....jsonld' file name
+        cached_players: Dictionary of cached player names
+        cached_teams: Dictionary of cached team names
+        
+    Returns:
+        Dictionary containing complete player and team information with Cantonese names
+    """
     result = {
         'player_id': None,
         'player_names': {},  # Will contain English and Cantonese names
@@ -116,81 +213,93 @@ def extract_all_teams(jsonld_file_path: str, cached_players: Dict = None, cached
         'has_cantonese_data': False  # Track if any Cantonese names found
     }
     
+    # @id index of the graph. Without name caches every name is read from the
+    # graph, so the index is filled during the statement walk below instead of
+    # in a second pass; with caches it is only built on a cache miss.
+    by_id = {} if not cached_players or not cached_teams else None
+    
+    # Extract ALL team information from detailed statements
+    graph = data.get('@graph') or ()
+    # Statements are collected straight into the result list rather than copied over later
+    team_statements = result['all_affiliations']
+    for item in graph:
+        if by_id is not None:
+            add_to_index(by_id, item)
+        
+        # Look for ALL P54 statements with detailed information. The key test
+        # comes first: it rules out nearly every node without a function call.
+        if 'ps:P54' not in item:
+            continue
+        
+        item_type = item.get('@type')
+        if item_type != 'wikibase:Statement':
+            if not (isinstance(item_type, list) and 'wikibase:Statement' in item_type):
+                continue
+        
+        team_ref = item['ps:P54']
+        
+        # Same team IDs recur across thousands of memberships, so share one string
+        team_id = sys.intern(team_ref[3:] if team_ref.startswith('wd:') else team_ref)
+        start_date = item.get('P580')  # start time
+        end_date = item.get('P582')    # end time
+        
+        # Check if this is a current team (no end date or special marker)
+        is_current = (end_date is None or 
+                     (isinstance(end_date, dict) and end_date.get('@id', '').startswith('_:')))
+        
+        team_info = {
+            'club_id': team_id,  # Keep 'club_id' for backward compatibility
+            'start_date': start_date,
+            'end_date': end_date,
+            'start_year': parse_date(start_date),
+            'end_year': parse_date(end_date),
+            'is_current': is_current,
+            'club_names': {},  # Will contain all names (English and Cantonese)
+            'name': 'Unknown',  # English name for backward compatibility
+            'description': '',  # English description for backward compatibility
+            'cantonese_name': 'Unknown',  # Best Cantonese name
+            'has_cantonese': False  # Whether this team has Cantonese names
+        }
+        
+        team_statements.append(team_info)
+    
     # Extract player ID from filename
     filename = os.path.basename(jsonld_file_path)
     if filename.startswith('Q') and filename.endswith('.jsonld'):
-        player_id = filename[:-7]  # Remove .jsonld extension
+        # Interned so every club_to_players entry shares one string object
+        player_id = sys.intern(filename[:-7])  # Remove .jsonld extension
         result['player_id'] = player_id
         
-        # Get player names from cache if available, otherwise use fallback
-        if cached_players:
-            cached_names = get_entity_names_from_cache(player_id, cached_players)
-            if cached_names:
-                result['player_names'] = cached_names
-            else:
-                # Fallback to dynamic extraction if not in cache
-                result['player_names'] = extract_entity_names(data, player_id, None)
-        else:
-            # No cache available, use dynamic extraction
-            result['player_names'] = extract_entity_names(data, player_id, None)
+        # Get player names from cache if available, otherwise extract them from the JSONLD data
+        player_names = get_entity_names_from_cache(player_id, cached_players)
+        if not player_names:
+            if by_id is None:
+                by_id = index_graph_by_id(data)
+            player_names = extract_entity_names_from_index(by_id, player_id, None)
+        result['player_names'] = player_names
         
         # Check if we have Cantonese data for the player
         if result['player_names']['cantonese_lang'] != 'none':
             result['has_cantonese_data'] = True
     
-    # Extract ALL team information from detailed statements
-    team_statements = []
-    for item in data.get('@graph', []):
-        # Look for ALL P54 statements with detailed information
-        item_type = item.get('@type')
-        is_statement = False
-        
-        if isinstance(item_type, list):
-            is_statement = 'wikibase:Statement' in item_type
-        elif isinstance(item_type, str):
-            is_statement = item_type == 'wikibase:Statement'
-        
-        if is_statement and 'ps:P54' in item:
-            
-            team_id = item.get('ps:P54', '').replace('wd:', '')
-            start_date = item.get('P580')  # start time
-            end_date = item.get('P582')    # end time
-            
-            # Check if this is a current team (no end date or special marker)
-            is_current = (end_date is None or 
-                         (isinstance(end_date, dict) and end_date.get('@id', '').startswith('_:')))
-            
-            team_info = {
-                'club_id': team_id,  # Keep 'club_id' for backward compatibility
-                'start_date': start_date,
-                'end_date': end_date,
-                'start_year': parse_date(start_date),
-                'end_year': parse_date(end_date),
-                'is_current': is_current,
-                'club_names': {},  # Will contain all names (English and Cantonese)
-                'name': 'Unknown',  # English name for backward compatibility
-                'description': '',  # English description for backward compatibility
-                'cantonese_name': 'Unknown',  # Best Cantonese name
-                'has_cantonese': False  # Whether this team has Cantonese names
-            }
-            
-            team_statements.append(team_info)
-    
-    # Extract team names and descriptions (English and Cantonese) from the JSONLD data
+    # Extract team names and descriptions (English and Cantonese) from the JSONLD data,
+    # categorizing each team into clubs and national teams as soon as its name is known
+    clubs = result['clubs']
+    national_teams = result['national_teams']
+    # Names already resolved in this file; loan spells and returns repeat a team
+    file_team_names = {}
     for team_info in team_statements:
         team_id = team_info['club_id']  # Using club_id field for backward compatibility
         if team_id:
-            # Get team names from cache if available, otherwise use fallback
-            if cached_teams:
-                cached_names = get_entity_names_from_cache(team_id, None, cached_teams)
-                if cached_names:
-                    team_names = cached_names
-                else:
-                    # Fallback to dynamic extraction if not in cache
-                    team_names = extract_entity_names(data, team_id, None)
-            else:
-                # No cache available, use dynamic extraction
-                team_names = extract_entity_names(data, team_id, None)
+            team_names = file_team_names.get(team_id)
+            if team_names is None:
+                # Get team names from cache if available, otherwise extract them from the JSONLD data
+                team_names = get_entity_names_from_cache(team_id, None, cached_teams)
+                if not team_names:
+                    if by_id is None:
+                        by_id = index_graph_by_id(data)
+                    team_names = extract_entity_names_from_index(by_id, team_id, None)
+                file_team_names[team_id] = team_names
             team_info['club_names'] = team_names
             
             # Set backward compatibility fields
@@ -203,35 +312,170 @@ def extract_all_teams(jsonld_file_path: str, cached_players: Dict = None, cached
             if team_info['has_cantonese']:
                 result['has_cantonese_data'] = True
         
-        result['all_affiliations'].append(team_info)
-    
-    # Categorize teams into clubs, national teams, and youth teams (filter out youth teams)
-    clubs, national_teams, youth_teams = categorize_teams(result['all_affiliations'])
-    result['clubs'] = clubs
-    result['national_teams'] = national_teams
-    # Note: youth_teams are filtered out and not included in the result
+        category = _team_category(team_info['name'], team_info['description'])
+        if category == 'club':
+            clubs.append(team_info)
+        elif category == 'national_team':
+            national_teams.append(team_info)
+        # Note: youth teams are filtered out and not included in the result
     
     # Separate current and former for both clubs and national teams
-    result['current_clubs'] = [team for team in clubs if team['is_current']]
-    result['former_clubs'] = [team for team in clubs if not team['is_current']]
-    result['current_national_teams'] = [team for team in national_teams if team['is_current']]
-    result['former_national_teams'] = [team for team in national_teams if not team['is_current']]
+    result['current_clubs'], result['former_clubs'] = _split_current(clubs)
+    result['current_national_teams'], result['former_national_teams'] = _split_current(national_teams)
     
     result['total_affiliations'] = len(result['all_affiliations'])
     
-    # Calculate career span
-    years = [team.get('start_year') for team in result['all_affiliations'] if team.get('start_year')]
-    if years:
+    # Calculate career span: earliest known start year and latest end year
+    # (at least the current year), in one pass over the affiliations
+    first_year = None
+    last_year = CURRENT_YEAR
+    for team in result['all_affiliations']:
+        start_year = team['start_year']
+        if start_year and (first_year is None or start_year < first_year):
+            first_year = start_year
+        end_year = team['end_year']
+        if end_year and end_year > last_year:
+            last_year = end_year
+    if first_year is not None:
         result['career_span_years'] = {
-            'start': min(years),
-            'end': max([team.get('end_year') for team in result['all_affiliations'] if team.get('end_year')] + [2025])
+            'start': first_year,
+            'end': last_year
         }
     
     return result
 
 
-def process_all_players(directory_path: str, cache_dir: str = None) -> Dict[str, Any]:
-    """Process all player files and return structured data using cached Cantonese names for improved performance."""
+# Name caches of a worker process, set once by _init_worker
+_worker_cached_players = None
+_worker_cached_teams = None
+
+
+def _init_worker(cached_players: Dict = None, cached_teams: Dict = None) -> None:
+    """Store the cached names in a worker process so they are not pickled per file."""
+    global _worker_cached_players, _worker_cached_teams
+    _worker_cached_players = cached_players
+    _worker_cached_teams = cached_teams
+
+
+def _extract_player_file(file_path: str, cached_players: Dict = None, cached_teams: Dict = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Run extract_all_teams on one file without letting errors escape.
+    Returns tuple of (player_data, error_message); exactly one of them is None.
+    """
+    try:
+        return extract_all_teams(file_path, cached_players, cached_teams), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _extract_worker(file_path: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Process pool entry point: extract one file using the worker's name caches."""
+    return _extract_player_file(file_path, _worker_cached_players, _worker_cached_teams)
+
+
+def _iter_player_files(file_paths: List[str], cached_players: Dict = None, cached_teams: Dict = None,
+                       max_workers: int = 1):
+    """
+    Yield (player_data, error_message) for each file path, in input order.
+    With max_workers > 1 the files are parsed in a pool of worker processes.
+    """
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(cached_players, cached_teams)) as executor:
+            yield from executor.map(_extract_worker, file_paths, chunksize=32)
+    else:
+        for file_path in file_paths:
+            yield _extract_player_file(file_path, cached_players, cached_teams)
+
+
+def _file_stamp(file_path: str) -> Tuple[int, int]:
+    """Modification time and size of a file, used to tell whether it changed."""
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _extraction_code_stamp() -> str:
+    """
+    Hash of the source of this module and the utilities extraction relies on,
+    so stored extraction results are never reused after that code changes.
+    """
+    digest = hashlib.sha256()
+    for source_path in (__file__, cantonese_utils.__file__, date_utils.__file__,
+                        file_utils.__file__, jsonld_reader.__file__):
+        with open(source_path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _iter_player_files_cached(file_paths: List[str], cached_players: Dict = None, cached_teams: Dict = None,
+                              max_workers: int = 1, results_cache_dir: str = None, names_stamp: Any = None):
+    """
+    Like _iter_player_files, but reuse extraction results pickled by an earlier run.
+    
+    Each result is stored in results_cache_dir together with the player file's
+    modification time and size, names_stamp (identifying the Cantonese name
+    caches the result was built with) and a hash of the extraction code. A
+    stored result is only reused when all of these still match; every other
+    file is extracted as usual and its result stored for the next run. Failed
+    extractions are not stored, and unreadable entries count as misses.
+    """
+    os.makedirs(results_cache_dir, exist_ok=True)
+    code_stamp = _extraction_code_stamp()
+    
+    cache_paths = {}
+    stamps = {}
+    stored_results = {}
+    missing_paths = []
+    for file_path in file_paths:
+        cache_path = cache_paths[file_path] = os.path.join(results_cache_dir, os.path.basename(file_path) + '.pickle')
+        stamp = stamps[file_path] = (_file_stamp(file_path), names_stamp, code_stamp)
+        try:
+            with open(cache_path, 'rb') as f:
+                stored_stamp, player_data = pickle.load(f)
+            if stored_stamp == stamp:
+                stored_results[file_path] = player_data
+                continue
+        except Exception:
+            # Missing, truncated or stale entries (e.g. pickles referring to
+            # classes that no longer exist) are simply extracted again
+            pass
+        missing_paths.append(file_path)
+    
+    fresh_results = _iter_player_files(missing_paths, cached_players, cached_teams, max_workers)
+    
+    for file_path in file_paths:
+        if file_path in stored_results:
+            yield stored_results.pop(file_path), None
+            continue
+        
+        player_data, error = next(fresh_results)
+        if error is None:
+            # Written under a temporary name and moved into place, so an
+            # interrupted run never leaves a truncated entry behind
+            cache_path = cache_paths[file_path]
+            tmp_path = cache_path + '.tmp'
+            try:
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump((stamps[file_path], player_data), f, pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        yield player_data, error
+
+
+def process_all_players(directory_path: str, cache_dir: str = None, max_workers: int = 1,
+                        results_cache_dir: str = None) -> Dict[str, Any]:
+    """
+    Process all player files and return structured data using cached Cantonese names for improved performance.
+    
+    Per-file extraction runs in max_workers processes when max_workers > 1;
+    results are merged in the calling process in directory listing order.
+    With results_cache_dir, per-file extraction results are kept there between
+    runs and only files that changed (or whose name caches or extraction code
+    changed) are parsed again.
+    """
     
     # Load cached Cantonese names if available
     cached_players = None
@@ -250,8 +494,8 @@ def process_all_players(directory_path: str, cache_dir: str = None) -> Dict[str,
         print("No cache directory provided or cache directory not found, proceeding without cache")
     
     all_players = {}
-    club_to_players = {}  # Map club_id to list of players who played there
-    national_team_to_players = {}  # Map national_team_id to list of players who played there
+    club_to_players = defaultdict(list)  # Map club_id to list of players who played there
+    national_team_to_players = defaultdict(list)  # Map national_team_id to list of players who played there
     cantonese_stats = {
         'players_with_cantonese': 0,
         'clubs_with_cantonese': set(),
@@ -269,17 +513,37 @@ def process_all_players(directory_path: str, cache_dir: str = None) -> Dict[str,
     
     print(f"Processing {len(files)} player files...")
     
-    for i, filename in enumerate(files, 1):
-        if i % 10 == 0:
+    file_paths = [os.path.join(directory_path, filename) for filename in files]
+    if results_cache_dir:
+        # Stored results embed names from the Cantonese name caches, so they
+        # are only valid for the same versions of those files
+        names_stamp = None
+        if cached_players and cached_teams:
+            names_stamp = tuple(_file_stamp(os.path.join(cache_dir, name))
+                                for name in ('players_cantonese_names.json', 'teams_cantonese_names.json'))
+        results = _iter_player_files_cached(file_paths, cached_players, cached_teams, max_workers,
+                                            results_cache_dir, names_stamp)
+    else:
+        results = _iter_player_files(file_paths, cached_players, cached_teams, max_workers)
+    
+    # Report progress about 20 times per run rather than every 10 files
+    progress_every = max(10, len(files) // 20)
+    
+    for i, (filename, (player_data, error)) in enumerate(zip(files, results), 1):
+        if i % progress_every == 0 or i == len(files):
             print(f"Processed {i}/{len(files)} files...")
-            
-        file_path = os.path.join(directory_path, filename)
+        
+        if error is not None:
+            print(f"Error processing {filename}: {error}")
+            continue
         
         try:
-            player_data = extract_all_teams(file_path, cached_players, cached_teams)
             player_id = player_data['player_id']
             
             if player_id:
+                # Results unpickled from worker processes carry their own copies of
+                # the interned IDs, so intern them again in this process
+                player_id = player_data['player_id'] = sys.intern(player_id)
                 all_players[player_id] = player_data
                 
                 # Track Cantonese statistics
@@ -287,16 +551,20 @@ def process_all_players(directory_path: str, cache_dir: str = None) -> Dict[str,
                     cantonese_stats['players_with_cantonese'] += 1
                 
                 # Track source of player Cantonese names
-                if player_data['player_names']['cantonese_source'] == 'wikidata':
+                player_names = player_data['player_names']
+                if player_names['cantonese_source'] == 'wikidata':
                     cantonese_stats['cantonese_from_wikidata'] += 1
-                elif player_data['player_names']['cantonese_source'] == 'paranames':
+                elif player_names['cantonese_source'] == 'paranames':
                     cantonese_stats['cantonese_from_paranames'] += 1
                 
+                # Player fields shared by every roster entry of this player
+                player_name_english = player_names['english']
+                player_name_cantonese = player_names['cantonese_best']
+                player_has_cantonese = player_names['cantonese_lang'] != 'none'
+                
                 # Build club-to-players and national-team-to-players mappings
                 for club in player_data['clubs']:
-                    club_id = club['club_id']
-                    if club_id not in club_to_players:
-                        club_to_players[club_id] = []
+                    club_id = club['club_id'] = sys.intern(club['club_id'])
                     
                     # Track clubs with Cantonese names and their sources
                     if club['has_cantonese']:
@@ -309,18 +577,16 @@ def process_all_players(directory_path: str, cache_dir: str = None) -> Dict[str,
                     
                     club_to_players[club_id].append({
                         'player_id': player_id,
-                        'player_name_english': player_data['player_names']['english'],
-                        'player_name_cantonese': player_data['player_names']['cantonese_best'],
-                        'player_has_cantonese': player_data['player_names']['cantonese_lang'] != 'none',
+                        'player_name_english': player_name_english,
+                        'player_name_cantonese': player_name_cantonese,
+                        'player_has_cantonese': player_has_cantonese,
                         'start_year': club.get('start_year'),
                         'end_year': club.get('end_year'),
                         'is_current': club['is_current']
                     })
                 
                 for national_team in player_data['national_teams']:
-                    team_id = national_team['club_id']
-                    if team_id not in national_team_to_players:
-                        national_team_to_players[team_id] = []
+                    team_id = national_team['club_id'] = sys.intern(national_team['club_id'])
                     
                     # Track national teams with Cantonese names and their sources
                     if national_team['has_cantonese']:
@@ -333,9 +599,9 @@ def process_all_players(directory_path: str, cache_dir: str = None) -> Dict[str,
                     
                     national_team_to_players[team_id].append({
                         'player_id': player_id,
-                        'player_name_english': player_data['player_names']['english'],
-                        'player_name_cantonese': player_data['player_names']['cantonese_best'],
-                        'player_has_cantonese': player_data['player_names']['cantonese_lang'] != 'none',
+                        'player_name_english': player_name_english,
+                        'player_name_cantonese': player_name_cantonese,
+                        'player_has_cantonese': player_has_cantonese,
                         'start_year': national_team.get('start_year'),
                         'end_year': national_team.get('end_year'),
                         'is_current': national_team['is_current']
@@ -356,8 +622,8 @@ def process_all_players(directory_path: str, cache_dir: str = None) -> Dict[str,
     
     return {
         'players': all_players,
-        'club_to_players': club_to_players,
-        'national_team_to_players': national_team_to_players,
+        'club_to_players': dict(club_to_players),
+        'national_team_to_players': dict(national_team_to_players),
         'cantonese_statistics': cantonese_stats,
         'processing_info': {
             'total_files': len(files),
@@ -367,193 +633,175 @@ def process_all_players(directory_path: str, cache_dir: str = None) -> Dict[str,
     }
 
 
-def find_potential_teammates(all_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+def _pair_member(player_id: str, player_info: Dict[str, Tuple[str, str, bool]],
+                 start_year: Optional[int], end_year: Optional[int]) -> Dict[str, Any]:
+    """Build the player part of a teammate pair record for one team membership."""
+    name_english, name_cantonese, has_cantonese = player_info[player_id]
+    return {
+        'id': player_id,
+        'name_english': name_english,
+        'name_cantonese': name_cantonese,
+        'has_cantonese': has_cantonese,
+        'start_year': start_year,
+        'end_year': end_year
+    }
+
+
+def _iter_team_pairs(team_id: str, roster: Tuple[List, List, List], team_names: Dict[str, Any],
+                     team_type: str, player_info: Dict[str, Tuple[str, str, bool]]) -> Iterator[Dict[str, Any]]:
     """
-    Find pairs of players who were potentially teammates, separated by club and national team affiliations.
-    Returns dictionary with 'club_teammates' and 'national_teammates' lists.
+    Yield a pair record for every two overlapping memberships of one team.
+    
+    The team dict and each membership's player dict are built once and shared
+    by all records they appear in; the records are only serialized afterwards,
+    never modified.
+    
+    Args:
+        team_id: ID of the team
+        roster: Parallel lists (player_ids, start_years, end_years) of the team's memberships
+        team_names: English/Cantonese names of the team
+        team_type: 'club' or 'national_team'
+        player_info: Map of player_id to (name_english, name_cantonese, has_cantonese)
     """
+    player_ids, start_years, end_years = roster
+    starts = [year or None for year in start_years]
+    ends = [year or CURRENT_YEAR for year in end_years]
+    pairs = _overlapping_pairs(starts, ends)
+    if not pairs:
+        return
     
-    club_teammates = []
-    national_teammates = []
+    team = {
+        'id': team_id,
+        'name_english': team_names['english'],
+        'name_cantonese': team_names['cantonese'],
+        'has_cantonese': team_names['has_cantonese'],
+        'type': team_type
+    }
+    team_has_cantonese = team_names['has_cantonese']
+    
+    members = {}
+    for i, j in pairs:
+        player1 = members.get(i)
+        if player1 is None:
+            player1 = members[i] = _pair_member(player_ids[i], player_info, start_years[i], end_years[i])
+        player2 = members.get(j)
+        if player2 is None:
+            player2 = members[j] = _pair_member(player_ids[j], player_info, start_years[j], end_years[j])
+        
+        yield {
+            'player1': player1,
+            'player2': player2,
+            'team': team,
+            'has_any_cantonese': (player1['has_cantonese'] or 
+                                player2['has_cantonese'] or 
+                                team_has_cantonese)
+        }
+
+
+def iter_potential_teammates(all_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield pairs of players who were potentially teammates, one record at a time.
+    Club pairs come first, then national team pairs; record['team']['type'] tells them apart.
+    """
     
-    # Build separate mappings for clubs and national teams
-    club_to_players = {}
-    national_team_to_players = {}
+    # Player names are stored once per player rather than copied into every membership
+    player_info = {}
+    # Team rosters as parallel lists: team_id -> (player_ids, start_years, end_years)
+    club_rosters = {}
+    national_team_rosters = {}
+    # Team names taken from the first membership seen for each team
+    club_names = {}
+    national_team_names = {}
     
     # Populate mappings
     for player_id, player_data in all_data['players'].items():
+        player_names = player_data['player_names']
+        player_info[player_id] = (
+            player_names['english'],
+            player_names['cantonese_best'],
+            player_names['cantonese_lang'] != 'none'
+        )
+        
         # Process club affiliations
         for club in player_data['clubs']:
             club_id = club['club_id']
-            if club_id not in club_to_players:
-                club_to_players[club_id] = []
-            
-            club_to_players[club_id].append({
-                'player_id': player_id,
-                'player_name_english': player_data['player_names']['english'],
-                'player_name_cantonese': player_data['player_names']['cantonese_best'],
-                'player_has_cantonese': player_data['player_names']['cantonese_lang'] != 'none',
-                'start_year': club.get('start_year'),
-                'end_year': club.get('end_year'),
-                'is_current': club['is_current']
-            })
+            roster = club_rosters.get(club_id)
+            if roster is None:
+                roster = club_rosters[club_id] = ([], [], [])
+                club_names[club_id] = {
+                    'english': club['name'],
+                    'cantonese': club['cantonese_name'],
+                    'has_cantonese': club['has_cantonese']
+                }
+            roster[0].append(player_id)
+            roster[1].append(club.get('start_year'))
+            roster[2].append(club.get('end_year'))
         
         # Process national team affiliations
         for national_team in player_data['national_teams']:
             team_id = national_team['club_id']  # Using same field name for consistency
-            if team_id not in national_team_to_players:
-                national_team_to_players[team_id] = []
-            
-            national_team_to_players[team_id].append({
-                'player_id': player_id,
-                'player_name_english': player_data['player_names']['english'],
-                'player_name_cantonese': player_data['player_names']['cantonese_best'],
-                'player_has_cantonese': player_data['player_names']['cantonese_lang'] != 'none',
-                'start_year': national_team.get('start_year'),
-                'end_year': national_team.get('end_year'),
-                'is_current': national_team['is_current']
-            })
+            roster = national_team_rosters.get(team_id)
+            if roster is None:
+                roster = national_team_rosters[team_id] = ([], [], [])
+                national_team_names[team_id] = {
+                    'english': national_team['name'],
+                    'cantonese': national_team['cantonese_name'],
+                    'has_cantonese': national_team['has_cantonese']
+                }
+            roster[0].append(player_id)
+            roster[1].append(national_team.get('start_year'))
+            roster[2].append(national_team.get('end_year'))
     
     # Find club teammates
-    for club_id, players_list in club_to_players.items():
-        if len(players_list) < 2:
+    for club_id, roster in club_rosters.items():
+        if len(roster[0]) < 2:
             continue
-            
-        # Check all pairs of players at this club
-        for i, player1 in enumerate(players_list):
-            for player2 in players_list[i+1:]:
-                
-                # Create club info for overlap checking
-                club1_info = {
-                    'start_date': f"{player1['start_year']}-01-01T00:00:00Z" if player1.get('start_year') else None,
-                    'end_date': f"{player1['end_year']}-01-01T00:00:00Z" if player1.get('end_year') else None
-                }
-                club2_info = {
-                    'start_date': f"{player2['start_year']}-01-01T00:00:00Z" if player2.get('start_year') else None,
-                    'end_date': f"{player2['end_year']}-01-01T00:00:00Z" if player2.get('end_year') else None
-                }
-                
-                if teams_overlap(club1_info, club2_info):
-                    # Get club names (English and Cantonese)
-                    team_names = {
-                        'english': "Unknown Club",
-                        'cantonese': "Unknown Club",
-                        'has_cantonese': False
-                    }
-                    
-                    # Find club names from player data
-                    for player_data in all_data['players'].values():
-                        for club in player_data['clubs']:
-                            if club['club_id'] == club_id:
-                                team_names['english'] = club['name']
-                                team_names['cantonese'] = club['cantonese_name']
-                                team_names['has_cantonese'] = club['has_cantonese']
-                                break
-                        if team_names['english'] != "Unknown Club":
-                            break
-                    
-                    club_teammates.append({
-                        'player1': {
-                            'id': player1['player_id'],
-                            'name_english': player1['player_name_english'],
-                            'name_cantonese': player1['player_name_cantonese'],
-                            'has_cantonese': player1['player_has_cantonese'],
-                            'start_year': player1.get('start_year'),
-                            'end_year': player1.get('end_year')
-                        },
-                        'player2': {
-                            'id': player2['player_id'], 
-                            'name_english': player2['player_name_english'],
-                            'name_cantonese': player2['player_name_cantonese'],
-                            'has_cantonese': player2['player_has_cantonese'],
-                            'start_year': player2.get('start_year'),
-                            'end_year': player2.get('end_year')
-                        },
-                        'team': {
-                            'id': club_id,
-                            'name_english': team_names['english'],
-                            'name_cantonese': team_names['cantonese'],
-                            'has_cantonese': team_names['has_cantonese'],
-                            'type': 'club'
-                        },
-                        'has_any_cantonese': (player1['player_has_cantonese'] or 
-                                            player2['player_has_cantonese'] or 
-                                            team_names['has_cantonese'])
-                    })
+        yield from _iter_team_pairs(club_id, roster, club_names[club_id], 'club', player_info)
     
     # Find national teammates (similar logic)
-    for team_id, players_list in national_team_to_players.items():
-        if len(players_list) < 2:
+    for team_id, roster in national_team_rosters.items():
+        if len(roster[0]) < 2:
             continue
-            
-        # Check all pairs of players at this national team
-        for i, player1 in enumerate(players_list):
-            for player2 in players_list[i+1:]:
-                
-                # Create team info for overlap checking
-                team1_info = {
-                    'start_date': f"{player1['start_year']}-01-01T00:00:00Z" if player1.get('start_year') else None,
-                    'end_date': f"{player1['end_year']}-01-01T00:00:00Z" if player1.get('end_year') else None
-                }
-                team2_info = {
-                    'start_date': f"{player2['start_year']}-01-01T00:00:00Z" if player2.get('start_year') else None,
-                    'end_date': f"{player2['end_year']}-01-01T00:00:00Z" if player2.get('end_year') else None
-                }
-                
-                if teams_overlap(team1_info, team2_info):
-                    # Get national team names (English and Cantonese)
-                    team_names = {
-                        'english': "Unknown National Team",
-                        'cantonese': "Unknown National Team",
-                        'has_cantonese': False
-                    }
-                    
-                    # Find national team names from player data
-                    for player_data in all_data['players'].values():
-                        for national_team in player_data['national_teams']:
-                            if national_team['club_id'] == team_id:
-                                team_names['english'] = national_team['name']
-                                team_names['cantonese'] = national_team['cantonese_name']
-                                team_names['has_cantonese'] = national_team['has_cantonese']
-                                break
-                        if team_names['english'] != "Unknown National Team":
-                            break
-                    
-                    national_teammates.append({
-                        'player1': {
-                            'id': player1['player_id'],
-                            'name_english': player1['player_name_english'],
-                            'name_cantonese': player1['player_name_cantonese'],
-                            'has_cantonese': player1['player_has_cantonese'],
-                            'start_year': player1.get('start_year'),
-                            'end_year': player1.get('end_year')
-                        },
-                        'player2': {
-                            'id': player2['player_id'], 
-                            'name_english': player2['player_name_english'],
-                            'name_cantonese': player2['player_name_cantonese'],
-                            'has_cantonese': player2['player_has_cantonese'],
-                            'start_year': player2.get('start_year'),
-                            'end_year': player2.get('end_year')
-                        },
-                        'team': {
-                            'id': team_id,
-                            'name_english': team_names['english'],
-                            'name_cantonese': team_names['cantonese'],
-                            'has_cantonese': team_names['has_cantonese'],
-                            'type': 'national_team'
-                        },
-                        'has_any_cantonese': (player1['player_has_cantonese'] or 
-                                            player2['player_has_cantonese'] or 
-                                            team_names['has_cantonese'])
-                    })
+        yield from _iter_team_pairs(team_id, roster, national_team_names[team_id], 'national_team', player_info)
+
+
+def find_potential_teammates(all_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Find pairs of players who were potentially teammates, separated by club and national team affiliations.
+    Returns dictionary with 'club_teammates' and 'national_teammates' lists, plus
+    'club_pairs_with_cantonese' and 'national_pairs_with_cantonese' counts of the
+    pairs where either player or the team has a Cantonese name, counted in the
+    same pass.
+    """
+    
+    club_teammates = []
+    national_teammates = []
+    club_pairs_with_cantonese = 0
+    national_pairs_with_cantonese = 0
+    
+    for record in iter_potential_teammates(all_data):
+        if record['team']['type'] == 'club':
+            club_teammates.append(record)
+            if record['has_any_cantonese']:
+                club_pairs_with_cantonese += 1
+        else:
+            national_teammates.append(record)
+            if record['has_any_cantonese']:
+                national_pairs_with_cantonese += 1
     
     return {
         'club_teammates': club_teammates,
-        'national_teammates': national_teammates
+        'national_teammates': national_teammates,
+        'club_pairs_with_cantonese': club_pairs_with_cantonese,
+        'national_pairs_with_cantonese': national_pairs_with_cantonese
     }
 
 
+def _year_label(date: Any, default: Optional[str]) -> Optional[str]:
+    """Year part of a WikiData date string, or default when the date is missing."""
+    return date[:4] if isinstance(date, str) and date else default
+
+
 def analyze_single_player(file_path: str, paranames_cantonese: Dict[str, Dict[str, str]] = None) -> None:
     """Analyze a single player file and display comprehensive team information with Cantonese names from both WikiData and ParaNames."""
     
@@ -561,7 +809,7 @@ def analyze_single_player(file_path: str, paranames_cantonese: Dict[str, Dict[st
     print("=" * 60)
     
     try:
-        team_info = extract_all_teams(file_path, cached_players, cached_teams)
+        team_info = extract_all_teams(file_path)
         
         # Display player information
         player_names = team_info['player_names']
@@ -573,10 +821,19 @@ def analyze_single_player(file_path: str, paranames_cantonese: Dict[str, Dict[st
         print(f"Clubs: {len(team_info['clubs'])}, National teams: {len(team_info['national_teams'])}")
         print(f"Has Cantonese data: {team_info['has_cantonese_data']}")
         
+        # Sort all affiliations by start date once; the former team listings
+        # below walk it backwards (most recent first)
+        def start_key(team):
+            return team.get('start_date') or ''
+        all_sorted = sorted(team_info['all_affiliations'], key=start_key)
+        # Affiliations are told apart by identity, so equal entries stay distinct
+        club_ids = {id(c) for c in team_info['clubs']}
+        national_team_ids = {id(t) for t in team_info['national_teams']}
+        
         if team_info['current_clubs']:
             print(f"\nCurrent Club(s) ({len(team_info['current_clubs'])}):")
             for club in team_info['current_clubs']:
-                start_year = club['start_date'][:4] if isinstance(club['start_date'], str) else "?"
+                start_year = _year_label(club['start_date'], "?")
                 print(f"  ✓ {club.get('name', 'Unknown')} ({club['club_id']}) - {start_year} to present")
                 if club['has_cantonese']:
                     source_info = f" (from {club['club_names'].get('cantonese_source', 'unknown')})" if 'cantonese_source' in club['club_names'] else ""
@@ -587,7 +844,7 @@ def analyze_single_player(file_path: str, paranames_cantonese: Dict[str, Dict[st
         if team_info['current_national_teams']:
             print(f"\nCurrent National Team(s) ({len(team_info['current_national_teams'])}):")
             for team in team_info['current_national_teams']:
-                start_year = team['start_date'][:4] if isinstance(team['start_date'], str) else "?"
+                start_year = _year_label(team['start_date'], "?")
                 print(f"  ✓ {team.get('name', 'Unknown')} ({team['club_id']}) - {start_year} to present")
                 if team['has_cantonese']:
                     source_info = f" (from {team['club_names'].get('cantonese_source', 'unknown')})" if 'cantonese_source' in team['club_names'] else ""
@@ -598,12 +855,11 @@ def analyze_single_player(file_path: str, paranames_cantonese: Dict[str, Dict[st
         if team_info['former_clubs']:
             print(f"\nFormer Clubs ({len(team_info['former_clubs'])}):")
             # Sort by start date (most recent first)
-            sorted_former = sorted(team_info['former_clubs'], 
-                                 key=lambda x: x.get('start_date', ''), reverse=True)
+            sorted_former = [c for c in reversed(all_sorted) if not c['is_current'] and id(c) in club_ids]
             
             for club in sorted_former:
-                start_year = club['start_date'][:4] if isinstance(club['start_date'], str) else "?"
-                end_year = club['end_date'][:4] if isinstance(club['end_date'], str) and club['end_date'] else "?"
+                start_year = _year_label(club['start_date'], "?")
+                end_year = _year_label(club['end_date'], "?")
                 period = f"{start_year}-{end_year}" if end_year != "?" else f"{start_year}-?"
                 
                 print(f"  • {club.get('name', 'Unknown')} ({club['club_id']}) - {period}")
@@ -616,12 +872,12 @@ def analyze_single_player(file_path: str, paranames_cantonese: Dict[str, Dict[st
         if team_info['former_national_teams']:
             print(f"\nFormer National Teams ({len(team_info['former_national_teams'])}):")
             # Sort by start date (most recent first)
-            sorted_former_national = sorted(team_info['former_national_teams'], 
-                                          key=lambda x: x.get('start_date', ''), reverse=True)
+            sorted_former_national = [t for t in reversed(all_sorted)
+                                      if not t['is_current'] and id(t) in national_team_ids]
             
             for team in sorted_former_national:
-                start_year = team['start_date'][:4] if isinstance(team['start_date'], str) else "?"
-                end_year = team['end_date'][:4] if isinstance(team['end_date'], str) and team['end_date'] else "?"
+                start_year = _year_label(team['start_date'], "?")
+                end_year = _year_label(team['end_date'], "?")
                 period = f"{start_year}-{end_year}" if end_year != "?" else f"{start_year}-?"
                 
                 print(f"  • {team.get('name', 'Unknown')} ({team['club_id']}) - {period}")
@@ -632,20 +888,16 @@ def analyze_single_player(file_path: str, paranames_cantonese: Dict[str, Dict[st
                     print(f"    └── {team['description']}")
         
         print("\nComplete Career Timeline with Cantonese Names:")
-        # Sort all affiliations by start date
-        all_affiliations_sorted = sorted(team_info['all_affiliations'], 
-                                        key=lambda x: x.get('start_date', ''))
-        
-        for i, affiliation in enumerate(all_affiliations_sorted, 1):
-            start_year = affiliation['start_date'][:4] if isinstance(affiliation['start_date'], str) else "?"
-            end_year = affiliation['end_date'][:4] if isinstance(affiliation['end_date'], str) and affiliation['end_date'] else "present"
+        for i, affiliation in enumerate(all_sorted, 1):
+            start_year = _year_label(affiliation['start_date'], "?")
+            end_year = _year_label(affiliation['end_date'], "present")
             status = "[CURRENT]" if affiliation['is_current'] else "[FORMER]"
             
             # Determine team type
             team_type = ""
-            if affiliation in team_info['clubs']:
+            if id(affiliation) in club_ids:
                 team_type = " [CLUB]"
-            elif affiliation in team_info['national_teams']:
+            elif id(affiliation) in national_team_ids:
                 team_type = " [NATIONAL]"
             
             # Enhanced indicators for Cantonese names and their sources
@@ -684,82 +936,125 @@ if __name__ == "__main__":
     # Process all players using cached names
     print("Starting comprehensive analysis of all players with Cantonese name extraction...")
     print("Using cached Cantonese names for improved performance...")
-    all_data = process_all_players(directory_path, cache_dir)
+    # Per-file extraction results are only kept between runs when asked for
+    results_cache_dir = None
+    if '--results-cache' in sys.argv[1:]:
+        results_cache_dir = os.path.join(get_soccer_intermediate_dir(), "extract_all_clubs_cache")
+        print(f"Reusing unchanged extraction results from {results_cache_dir}")
+    all_data = process_all_players(directory_path, cache_dir, max_workers=os.cpu_count() or 1,
+                                   results_cache_dir=results_cache_dir)
     
-    # Filter to keep only players with Cantonese names
+    # Filter to keep only players with Cantonese names, and in the same pass
+    # rebuild club_to_players and national_team_to_players mappings with the
+    # kept players only, count teams with Cantonese names and collect every
+    # unique club and national team, so each player is visited once.
     print("Filtering players to keep only those with Cantonese names...")
+    print("Rebuilding club and national team mappings with filtered players...")
+    print("Extracting all unique clubs and national teams information...")
     original_player_count = len(all_data['players'])
-    filtered_players = {
-        player_id: player_data 
-        for player_id, player_data in all_data['players'].items() 
-        if player_data['has_cantonese_data']
-    }
-    
-    # Update the players dictionary
-    all_data['players'] = filtered_players
+    filtered_players = {}
+    filtered_club_to_players = defaultdict(list)
+    filtered_national_team_to_players = defaultdict(list)
+    all_clubs = {}
+    all_national_teams = {}
     
-    # Rebuild club_to_players and national_team_to_players mappings with filtered players only
-    print("Rebuilding club and national team mappings with filtered players...")
-    filtered_club_to_players = {}
-    filtered_national_team_to_players = {}
+    filtered_cantonese_stats = {
+        'players_with_cantonese': 0,  # Player counts are set after the pass
+        # Dicts used as insertion-ordered sets of team IDs
+        'clubs_with_cantonese': {},
+        'national_teams_with_cantonese': {},
+        'total_cantonese_club_entries': 0,
+        'total_cantonese_national_team_entries': 0,
+        'original_player_count': original_player_count,
+        'filtered_player_count': 0,
+        'filtering_ratio': 0
+    }
     
-    for player_id, player_data in filtered_players.items():
+    for player_id, player_data in all_data['players'].items():
+        if not player_data['has_cantonese_data']:
+            continue
+        filtered_players[player_id] = player_data
+        
+        # Player fields shared by every roster entry of this player
+        player_names = player_data['player_names']
+        player_name_english = player_names['english']
+        player_name_cantonese = player_names['cantonese_best']
+        player_has_cantonese = player_names['cantonese_lang'] != 'none'
+        
         for club in player_data['clubs']:
             club_id = club['club_id']
-            if club_id not in filtered_club_to_players:
-                filtered_club_to_players[club_id] = []
+            roster = filtered_club_to_players[club_id]
             
-            filtered_club_to_players[club_id].append({
+            # The first membership of a team adds it to all_clubs
+            if not roster:
+                all_clubs[club_id] = {
+                    'name_english': club['name'],
+                    'name_cantonese': club['cantonese_name'],
+                    'has_cantonese': club['has_cantonese'],
+                    'description_english': club['description'],
+                    'club_names': club['club_names'],
+                    'player_count': 0  # Set once all memberships are collected
+                }
+            
+            roster.append({
                 'player_id': player_id,
-                'player_name_english': player_data['player_names']['english'],
-                'player_name_cantonese': player_data['player_names']['cantonese_best'],
-                'player_has_cantonese': player_data['player_names']['cantonese_lang'] != 'none',
+                'player_name_english': player_name_english,
+                'player_name_cantonese': player_name_cantonese,
+                'player_has_cantonese': player_has_cantonese,
                 'start_year': club.get('start_year'),
                 'end_year': club.get('end_year'),
                 'is_current': club['is_current']
             })
+            
+            # Count clubs with Cantonese names in filtered data
+            if club['has_cantonese']:
+                filtered_cantonese_stats['clubs_with_cantonese'][club_id] = None
+                filtered_cantonese_stats['total_cantonese_club_entries'] += 1
         
         for national_team in player_data['national_teams']:
             team_id = national_team['club_id']
-            if team_id not in filtered_national_team_to_players:
-                filtered_national_team_to_players[team_id] = []
+            roster = filtered_national_team_to_players[team_id]
             
-            filtered_national_team_to_players[team_id].append({
+            # The first membership of a team adds it to all_national_teams
+            if not roster:
+                all_national_teams[team_id] = {
+                    'name_english': national_team['name'],
+                    'name_cantonese': national_team['cantonese_name'],
+                    'has_cantonese': national_team['has_cantonese'],
+                    'description_english': national_team['description'],
+                    'club_names': national_team['club_names'],
+                    'player_count': 0  # Set once all memberships are collected
+                }
+            
+            roster.append({
                 'player_id': player_id,
-                'player_name_english': player_data['player_names']['english'],
-                'player_name_cantonese': player_data['player_names']['cantonese_best'],
-                'player_has_cantonese': player_data['player_names']['cantonese_lang'] != 'none',
+                'player_name_english': player_name_english,
+                'player_name_cantonese': player_name_cantonese,
+                'player_has_cantonese': player_has_cantonese,
                 'start_year': national_team.get('start_year'),
                 'end_year': national_team.get('end_year'),
                 'is_current': national_team['is_current']
             })
+            
+            # Count national teams with Cantonese names in filtered data
+            if national_team['has_cantonese']:
+                filtered_cantonese_stats['national_teams_with_cantonese'][team_id] = None
+                filtered_cantonese_stats['total_cantonese_national_team_entries'] += 1
     
-    all_data['club_to_players'] = filtered_club_to_players
-    all_data['national_team_to_players'] = filtered_national_team_to_players
+    # Update the players dictionary
+    all_data['players'] = filtered_players
+    filtered_cantonese_stats['players_with_cantonese'] = len(filtered_players)
+    filtered_cantonese_stats['filtered_player_count'] = len(filtered_players)
+    filtered_cantonese_stats['filtering_ratio'] = round(len(filtered_players) / original_player_count * 100, 2)
     
-    # Update Cantonese statistics for filtered data
-    filtered_cantonese_stats = {
-        'players_with_cantonese': len(filtered_players),
-        'clubs_with_cantonese': set(),
-        'national_teams_with_cantonese': set(),
-        'total_cantonese_club_entries': 0,
-        'total_cantonese_national_team_entries': 0,
-        'original_player_count': original_player_count,
-        'filtered_player_count': len(filtered_players),
-        'filtering_ratio': round(len(filtered_players) / original_player_count * 100, 2)
-    }
+    # Count players for each club and national team
+    for club_id, club in all_clubs.items():
+        club['player_count'] = len(filtered_club_to_players[club_id])
+    for team_id, national_team in all_national_teams.items():
+        national_team['player_count'] = len(filtered_national_team_to_players[team_id])
     
-    # Count clubs and national teams with Cantonese names in filtered data
-    for player_data in filtered_players.values():
-        for club in player_data['clubs']:
-            if club['has_cantonese']:
-                filtered_cantonese_stats['clubs_with_cantonese'].add(club['club_id'])
-                filtered_cantonese_stats['total_cantonese_club_entries'] += 1
-        
-        for national_team in player_data['national_teams']:
-            if national_team['has_cantonese']:
-                filtered_cantonese_stats['national_teams_with_cantonese'].add(national_team['club_id'])
-                filtered_cantonese_stats['total_cantonese_national_team_entries'] += 1
+    all_data['club_to_players'] = dict(filtered_club_to_players)
+    all_data['national_team_to_players'] = dict(filtered_national_team_to_players)
     
     filtered_cantonese_stats['unique_clubs_with_cantonese'] = len(filtered_cantonese_stats['clubs_with_cantonese'])
     filtered_cantonese_stats['unique_national_teams_with_cantonese'] = len(filtered_cantonese_stats['national_teams_with_cantonese'])
@@ -768,40 +1063,6 @@ if __name__ == "__main__":
     
     all_data['cantonese_statistics'] = filtered_cantonese_stats
     
-    # Extract all unique clubs and national teams with their information
-    print("Extracting all unique clubs and national teams information...")
-    all_clubs = {}
-    all_national_teams = {}
-    
-    for player_data in filtered_players.values():
-        for club in player_data['clubs']:
-            club_id = club['club_id']
-            if club_id not in all_clubs:
-                all_clubs[club_id] = {
-                    'name_english': club['name'],
-                    'name_cantonese': club['cantonese_name'],
-                    'has_cantonese': club['has_cantonese'],
-                    'description_english': club['description'],
-                    'club_names': club['club_names'],
-                    'player_count': 0  # Will be updated below
-                }
-            # Count unique players for this club
-            all_clubs[club_id]['player_count'] = len(filtered_club_to_players.get(club_id, []))
-        
-        for national_team in player_data['national_teams']:
-            team_id = national_team['club_id']
-            if team_id not in all_national_teams:
-                all_national_teams[team_id] = {
-                    'name_english': national_team['name'],
-                    'name_cantonese': national_team['cantonese_name'],
-                    'has_cantonese': national_team['has_cantonese'],
-                    'description_english': national_team['description'],
-                    'club_names': national_team['club_names'],
-                    'player_count': 0  # Will be updated below
-                }
-            # Count unique players for this national team
-            all_national_teams[team_id]['player_count'] = len(filtered_national_team_to_players.get(team_id, []))
-    
     # Find potential teammates with filtered data (separated by club and national team)
     print("Finding potential teammates among players with Cantonese names...")
     teammates_data = find_potential_teammates(all_data)
@@ -811,6 +1072,16 @@ if __name__ == "__main__":
     # Prepare enhanced output data with Cantonese information (filtered)
     cantonese_stats = all_data['cantonese_statistics']
     
+    # ParaNames contribution, shared by the metadata and the summary below
+    paranames_info = {
+        'players_from_wikidata': cantonese_stats.get('cantonese_from_wikidata', 0),
+        'players_from_paranames': cantonese_stats.get('cantonese_from_paranames', 0),
+        'clubs_enhanced_by_paranames': cantonese_stats.get('unique_clubs_enhanced_by_paranames', 0),
+        'national_teams_enhanced_by_paranames': cantonese_stats.get('unique_national_teams_enhanced_by_paranames', 0),
+        'clubs_enhanced_list': cantonese_stats.get('clubs_enhanced_by_paranames', []),
+        'national_teams_enhanced_list': cantonese_stats.get('national_teams_enhanced_by_paranames', [])
+    }
+    
     output_data = {
         'metadata': {
             'description': 'Football player club affiliations extracted from WikiData for Cantonese benchmark construction - FILTERED for players with Cantonese names only',
@@ -842,16 +1113,9 @@ if __name__ == "__main__":
                 'total_club_entries_with_cantonese': cantonese_stats['total_cantonese_club_entries'],
                 'total_national_team_entries_with_cantonese': cantonese_stats['total_cantonese_national_team_entries'],
                 'coverage_percentage_players': 100.0,  # 100% since all remaining players have Cantonese names
-                'club_teammate_pairs_with_cantonese': len([t for t in club_teammates if t['has_any_cantonese']]),
-                'national_teammate_pairs_with_cantonese': len([t for t in national_teammates if t['has_any_cantonese']]),
-                'paranames_enhancement': {
-                    'players_from_wikidata': cantonese_stats.get('cantonese_from_wikidata', 0),
-                    'players_from_paranames': cantonese_stats.get('cantonese_from_paranames', 0),
-                    'clubs_enhanced_by_paranames': cantonese_stats.get('unique_clubs_enhanced_by_paranames', 0),
-                    'national_teams_enhanced_by_paranames': cantonese_stats.get('unique_national_teams_enhanced_by_paranames', 0),
-                    'clubs_enhanced_list': cantonese_stats.get('clubs_enhanced_by_paranames', []),
-                    'national_teams_enhanced_list': cantonese_stats.get('national_teams_enhanced_by_paranames', [])
-                }
+                'club_teammate_pairs_with_cantonese': teammates_data['club_pairs_with_cantonese'],
+                'national_teammate_pairs_with_cantonese': teammates_data['national_pairs_with_cantonese'],
+                'paranames_enhancement': paranames_info
             }
         },
         'players': all_data['players'],
@@ -873,39 +1137,41 @@ if __name__ == "__main__":
     output_dir = get_soccer_intermediate_dir()
     os.makedirs(output_dir, exist_ok=True)
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
-    
-    print("\n" + "="*80)
-    print("CANTONESE FILTERING COMPLETE (Enhanced with ParaNames)")
-    print("="*80)
-    print(f"✓ Original players processed: {cantonese_stats['original_player_count']}")
-    print(f"✓ Players with Cantonese names retained: {len(all_data['players'])} ({cantonese_stats['filtering_ratio']}%)")
-    print(f"✓ Players without Cantonese names filtered out: {cantonese_stats['original_player_count'] - len(all_data['players'])}")
-    print(f"✓ Found {len(all_data['club_to_players'])} unique clubs in filtered data")
-    print(f"✓ Found {len(all_data.get('national_team_to_players', {}))} unique national teams in filtered data")
-    print(f"✓ All clubs dictionary contains {len(all_clubs)} clubs indexed by club_id")
-    print(f"✓ All national teams dictionary contains {len(all_national_teams)} national teams indexed by team_id")
-    print(f"✓ Identified {len(club_teammates)} potential club teammate pairs")
-    print(f"✓ Identified {len(national_teammates)} potential national teammate pairs")
-    print(f"✓ Clubs with Cantonese names: {cantonese_stats['unique_clubs_with_cantonese']}")
-    print(f"✓ National teams with Cantonese names: {cantonese_stats.get('unique_national_teams_with_cantonese', 0)}")
-    print(f"✓ Clubs enhanced by ParaNames: {cantonese_stats.get('unique_clubs_enhanced_by_paranames', 0)}")
-    print(f"✓ National teams enhanced by ParaNames: {cantonese_stats.get('unique_national_teams_enhanced_by_paranames', 0)}")
-    print(f"✓ Player names from WikiData: {cantonese_stats.get('cantonese_from_wikidata', 0)}")
-    print(f"✓ Player names from ParaNames: {cantonese_stats.get('cantonese_from_paranames', 0)}")
-    print(f"✓ Filtered data saved to: {output_file}")
+    write_json(output_file, output_data)
     
     processing_time = time.time() - start_time
-    print(f"✓ Processing time: {processing_time:.2f} seconds")
-    
-    print("\nFiltered dataset contains ONLY players with valid Cantonese names and can be used for:")
-    print("  • Cantonese benchmark questions about player club careers")
-    print("  • Cantonese benchmark questions about player national team careers")
-    print("  • Club teammate relationship questions with Cantonese names")
-    print("  • National team teammate relationship questions with Cantonese names")
-    print("  • Bilingual player career timelines and transfers")
-    print("  • Translation tasks between English and Cantonese player/team names")
-    print("  • All questions will have guaranteed Cantonese name coverage")
-    print("  • Performance optimized with cached Cantonese names")
-    print("  • Youth teams are completely filtered out from the dataset")
+    
+    # Assemble the summary and print it in one go
+    summary = [
+        "\n" + "="*80,
+        "CANTONESE FILTERING COMPLETE (Enhanced with ParaNames)",
+        "="*80,
+        f"✓ Original players processed: {cantonese_stats['original_player_count']}",
+        f"✓ Players with Cantonese names retained: {len(all_data['players'])} ({cantonese_stats['filtering_ratio']}%)",
+        f"✓ Players without Cantonese names filtered out: {cantonese_stats['original_player_count'] - len(all_data['players'])}",
+        f"✓ Found {len(all_data['club_to_players'])} unique clubs in filtered data",
+        f"✓ Found {len(all_data.get('national_team_to_players', {}))} unique national teams in filtered data",
+        f"✓ All clubs dictionary contains {len(all_clubs)} clubs indexed by club_id",
+        f"✓ All national teams dictionary contains {len(all_national_teams)} national teams indexed by team_id",
+        f"✓ Identified {len(club_teammates)} potential club teammate pairs",
+        f"✓ Identified {len(national_teammates)} potential national teammate pairs",
+        f"✓ Clubs with Cantonese names: {cantonese_stats['unique_clubs_with_cantonese']}",
+        f"✓ National teams with Cantonese names: {cantonese_stats.get('unique_national_teams_with_cantonese', 0)}",
+        f"✓ Clubs enhanced by ParaNames: {paranames_info['clubs_enhanced_by_paranames']}",
+        f"✓ National teams enhanced by ParaNames: {paranames_info['national_teams_enhanced_by_paranames']}",
+        f"✓ Player names from WikiData: {paranames_info['players_from_wikidata']}",
+        f"✓ Player names from ParaNames: {paranames_info['players_from_paranames']}",
+        f"✓ Filtered data saved to: {output_file}",
+        f"✓ Processing time: {processing_time:.2f} seconds",
+        "\nFiltered dataset contains ONLY players with valid Cantonese names and can be used for:",
+        "  • Cantonese benchmark questions about player club careers",
+        "  • Cantonese benchmark questions about player national team careers",
+        "  • Club teammate relationship questions with Cantonese names",
+        "  • National team teammate relationship questions with Cantonese names",
+        "  • Bilingual player career timelines and transfers",
+        "  • Translation tasks between English and Cantonese player/team names",
+        "  • All questions will have guaranteed Cantonese name coverage",
+        "  • Performance optimized with cached Cantonese names",
+        "  • Youth teams are completely filtered out from the dataset",
+    ]
+    print("\n".join(summary))
@@ -73,13 +73,16 @@ def extract_all_entity_ids_from_jsonld(jsonld_file_path: str) -> Set[str]:
     return entity_ids
 
 
-def extract_all_cantonese_names(directory_path: str, paranames_tsv_path: str = None) -> Dict[str, Any]:
+def extract_all_cantonese_names(directory_path: str, paranames_tsv_path: str = None,
+                                paranames_subset_cache_path: str = None) -> Dict[str, Any]:
     """
     Extract Cantonese names for all entities found in JSONLD files.
     
     Args:
         directory_path: Path to directory containing JSONLD files
         paranames_tsv_path: Path to ParaNames TSV file (optional)
+        paranames_subset_cache_path: Path of a JSON file caching the Cantonese rows of
+            the ParaNames TSV between runs (optional)
         
     Returns:
         Dictionary containing all entity names and metadata
@@ -87,7 +90,7 @@ def extract_all_cantonese_names(directory_path: str, paranames_tsv_path: str = N
     # Load ParaNames Cantonese data if provided
     paranames_cantonese = {}
     if paranames_tsv_path:
-        paranames_cantonese = load_paranames_cantonese(paranames_tsv_path)
+        paranames_cantonese = load_paranames_cantonese(paranames_tsv_path, paranames_subset_cache_path)
     
     # Get all JSONLD files
     jsonld_files = get_all_jsonld_files(directory_path)
@@ -302,6 +305,7 @@ if __name__ == "__main__":
     directory_path = get_football_players_triples_dir()
     paranames_path = os.path.join(get_soccer_raw_dir(), "paranames.tsv")
     output_dir = get_cantonese_mapping_dir()
+    paranames_subset_path = os.path.join(output_dir, "paranames_cantonese_subset.json")
     
     # Check if directory exists
     if not os.path.exists(directory_path):
@@ -311,7 +315,7 @@ if __name__ == "__main__":
     # Extract all Cantonese names
     print("Starting comprehensive Cantonese name extraction...")
     print("This will process all JSONLD files and create cached name mappings...")
-    all_data = extract_all_cantonese_names(directory_path, paranames_path)
+    all_data = extract_all_cantonese_names(directory_path, paranames_path, paranames_subset_path)
     
     if 'error' in all_data:
         print(f"Error: {all_data['error']}")
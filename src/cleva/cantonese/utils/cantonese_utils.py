@@ -6,14 +6,24 @@ Utilities for handling Cantonese names and caching.
 import json
 import os
 import csv
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
-def load_paranames_cantonese(paranames_tsv_path: str) -> Dict[str, Dict[str, str]]:
+import orjson
+
+from .file_utils import write_json
+
+def load_paranames_cantonese(paranames_tsv_path: str, subset_cache_path: Optional[str] = None) -> Dict[str, Dict[str, str]]:
     """
     Load Cantonese names from ParaNames dataset.
     
+    The full TSV is large but only its yue/zh-hk rows are kept, so the
+    extracted subset can be saved to subset_cache_path and read back on
+    later runs. The cache records the TSV's modification time and size and
+    is only used while both still match; an unreadable cache is rebuilt.
+    
     Args:
         paranames_tsv_path: Path to the paranames.tsv file
+        subset_cache_path: Optional path of a JSON file caching the Cantonese subset
         
     Returns:
         Dictionary mapping wikidata_id to cantonese names (yue and zh-hk)
@@ -24,26 +34,82 @@ def load_paranames_cantonese(paranames_tsv_path: str) -> Dict[str, Dict[str, str
         print(f"Warning: ParaNames file not found at {paranames_tsv_path}")
         return cantonese_names
     
+    tsv_stat = os.stat(paranames_tsv_path)
+    tsv_stamp = [tsv_stat.st_mtime_ns, tsv_stat.st_size]
+    
+    if subset_cache_path:
+        cached_names = _load_paranames_subset_cache(subset_cache_path, tsv_stamp)
+        if cached_names is not None:
+            print(f"Loading Cantonese names from ParaNames subset cache: {subset_cache_path}")
+            print(f"Loaded Cantonese names for {len(cached_names)} entities from ParaNames")
+            return cached_names
+    
     print(f"Loading Cantonese names from ParaNames dataset: {paranames_tsv_path}")
     
     with open(paranames_tsv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f, delimiter='\t')
+        # Plain csv.reader rows with column indices from the header, rather than
+        # a DictReader dict for each of the millions of mostly discarded rows
+        reader = csv.reader(f, delimiter='\t')
+        header = next(reader, [])
+        
+        try:
+            id_column = header.index('wikidata_id')
+            language_column = header.index('language')
+            label_column = header.index('label')
+        except ValueError:
+            print(f"Warning: ParaNames file has no wikidata_id/language/label columns: {paranames_tsv_path}")
+            return cantonese_names
+        
+        min_row_length = max(id_column, language_column, label_column) + 1
         
         for row in reader:
-            wikidata_id = row.get('wikidata_id', '').strip()
-            language = row.get('language', '').strip()
-            label = row.get('label', '').strip()
+            if len(row) < min_row_length:
+                continue
             
             # Only process Cantonese-related language codes
-            if language in ['yue', 'zh-hk'] and wikidata_id and label:
-                if wikidata_id not in cantonese_names:
-                    cantonese_names[wikidata_id] = {}
+            language = row[language_column].strip()
+            if language != 'yue' and language != 'zh-hk':
+                continue
+            
+            wikidata_id = row[id_column].strip()
+            label = row[label_column].strip()
+            if wikidata_id and label:
+                entity_names = cantonese_names.get(wikidata_id)
+                if entity_names is None:
+                    entity_names = cantonese_names[wikidata_id] = {}
                 
-                cantonese_names[wikidata_id][language] = label
+                entity_names[language] = label
     
     print(f"Loaded Cantonese names for {len(cantonese_names)} entities from ParaNames")
+    
+    if subset_cache_path:
+        os.makedirs(os.path.dirname(subset_cache_path) or '.', exist_ok=True)
+        write_json(subset_cache_path, {'tsv_stamp': tsv_stamp, 'names': cantonese_names})
+        print(f"Saved ParaNames Cantonese subset to {subset_cache_path}")
+    
     return cantonese_names
 
+def _load_paranames_subset_cache(subset_cache_path: str, tsv_stamp: List[int]) -> Optional[Dict[str, Dict[str, str]]]:
+    """
+    Read a ParaNames subset cache written for the TSV with the given stamp.
+    
+    Args:
+        subset_cache_path: Path of the JSON subset cache
+        tsv_stamp: [st_mtime_ns, st_size] of the current ParaNames TSV
+        
+    Returns:
+        The cached names, or None if the cache is missing, unreadable or stale
+    """
+    try:
+        with open(subset_cache_path, 'rb') as f:
+            cached = orjson.loads(f.read())
+        if cached.get('tsv_stamp') == tsv_stamp:
+            return cached['names']
+    except Exception:
+        # Missing, truncated or older-format caches are rebuilt from the TSV
+        pass
+    return None
+
 def get_best_cantonese_name(cantonese_labels: Dict[str, str]) -> Tuple[str, str]:
     """
     Get the best Cantonese name from available labels.
@@ -3,8 +3,19 @@
 Utilities for handling date parsing.
 """
 
+# Years already parsed, keyed by date string; the same WikiData dates recur
+# across many players and clubs. Bounded so long runs can't grow it forever.
+_YEAR_CACHE = {}
+_YEAR_CACHE_MAX_SIZE = 100000
+
+
 def parse_date(date_str):
     """Parse WikiData date string to extract year."""
-    if isinstance(date_str, str) and len(date_str) >= 4:
-        return int(date_str[:4])
+    if isinstance(date_str, str):
+        year = _YEAR_CACHE.get(date_str)
+        if year is None and len(date_str) >= 4:
+            year = int(date_str[:4])
+            if len(_YEAR_CACHE) < _YEAR_CACHE_MAX_SIZE:
+                _YEAR_CACHE[date_str] = year
+        return year
     return None
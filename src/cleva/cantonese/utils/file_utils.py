@@ -5,7 +5,13 @@ Utilities for file system operations.
 
 import json
 import os
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, BinaryIO
+
+import orjson
+
+# Output files are written through a 1 MiB buffer instead of the default
+# 8 KiB, so multi-megabyte outputs take far fewer write() system calls
+WRITE_BUFFER_SIZE = 1 << 20
 
 def extract_player_id_from_filename(jsonld_file_path: str) -> Optional[str]:
     """
@@ -43,3 +49,55 @@ def load_player_data(file_path: str) -> Dict[str, Any]:
     """Load the complete player club data."""
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
+
+
+def write_json(file_path: str, data: Any) -> None:
+    """
+    Write data as UTF-8 JSON indented by two spaces.
+    
+    Produces the same layout as json.dump(data, f, indent=2, ensure_ascii=False)
+    but serializes with orjson. Floats are the one exception: orjson spells
+    some of them differently (1e16 rather than 1e+16, 0.000025 rather than
+    2.5e-05), though they parse back to the same values. A top-level dict is written one section at a
+    time, so only the encoded bytes of the current section are held in memory.
+    The file is written under a temporary name and moved into place once
+    complete, so an interrupted run leaves any previous output intact.
+    
+    Args:
+        file_path: Path to the output .json file
+        data: JSON-serializable data
+    """
+    tmp_path = file_path + '.tmp'
+    try:
+        with open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            _write_indented_json(f, data)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        _remove_if_exists(tmp_path)
+        raise
+
+
+def _write_indented_json(f: BinaryIO, data: Any) -> None:
+    """Write data to a binary file in the json.dump(indent=2) layout, section by section."""
+    if not isinstance(data, dict) or not data:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    
+    separator = b'{\n  '
+    for key, value in data.items():
+        f.write(separator)
+        f.write(orjson.dumps(key))
+        f.write(b': ')
+        # Nest the section one level deeper; encoded strings never contain
+        # a raw newline, so every newline here is a layout line break
+        f.write(orjson.dumps(value, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  '))
+        separator = b',\n  '
+    f.write(b'\n}')
+
+
+def _remove_if_exists(file_path: str) -> None:
+    """Delete a file, ignoring the case where it was never created."""
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
@@ -6,12 +6,51 @@ This module provides shared functionality for extracting information from
 WikiData JSONLD files to avoid code duplication across different extraction scripts.
 """
 
-import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
+
+import orjson
 
 from .cantonese_utils import get_best_cantonese_name
 
 
+def index_graph_by_id(data: dict) -> Dict[str, List[dict]]:
+    """
+    Index the @graph nodes of parsed JSON-LD data by their @id.
+    
+    WikiData dumps split one entity over several nodes sharing the same @id
+    (labels, statement links, ...), so each @id maps to all of its nodes in
+    document order.
+    
+    Args:
+        data: The parsed JSON-LD data
+        
+    Returns:
+        Dictionary mapping @id (e.g. 'wd:Q107051') to the list of its nodes
+    """
+    by_id = {}
+    for item in data.get('@graph', []):
+        add_to_index(by_id, item)
+    return by_id
+
+
+def add_to_index(by_id: Dict[str, List[dict]], item: dict) -> None:
+    """
+    Add one @graph node to an index built like index_graph_by_id.
+    Nodes without an @id are skipped.
+    
+    Args:
+        by_id: Index of @graph nodes, updated in place
+        item: The @graph node to add
+    """
+    item_id = item.get('@id')
+    if item_id:
+        nodes = by_id.get(item_id)
+        if nodes is None:
+            by_id[item_id] = [item]
+        else:
+            nodes.append(item)
+
+
 def extract_entity_names(data: dict, target_id: str, paranames_cantonese: Dict[str, Dict[str, str]] = None) -> Dict[str, Any]:
     """
     Extract all available names for an entity (English, Cantonese, etc.).
@@ -25,6 +64,33 @@ def extract_entity_names(data: dict, target_id: str, paranames_cantonese: Dict[s
     Returns:
         Dictionary containing all available names and metadata
     """
+    target = f'wd:{target_id}'
+    nodes = [item for item in data.get('@graph', []) if item.get('@id', '') == target]
+    return _extract_names_from_nodes(nodes, target_id, paranames_cantonese)
+
+
+def extract_entity_names_from_index(by_id: Dict[str, List[dict]], target_id: str,
+                                    paranames_cantonese: Dict[str, Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Extract all available names for an entity using a prebuilt @id index.
+    
+    Same result as extract_entity_names, but looks the entity's nodes up in
+    the index from index_graph_by_id instead of scanning the whole @graph,
+    which matters when many entities are resolved from one file.
+    
+    Args:
+        by_id: Index of @graph nodes from index_graph_by_id
+        target_id: The entity ID to extract names for
+        paranames_cantonese: Dictionary of Cantonese names from ParaNames dataset
+        
+    Returns:
+        Dictionary containing all available names and metadata
+    """
+    return _extract_names_from_nodes(by_id.get(f'wd:{target_id}', ()), target_id, paranames_cantonese)
+
+
+def _extract_names_from_nodes(nodes, target_id: str, paranames_cantonese: Dict[str, Dict[str, str]] = None) -> Dict[str, Any]:
+    """Build the names dictionary for an entity from the @graph nodes carrying its @id."""
     names = {
         'id': target_id,
         'english': 'Unknown',
@@ -36,48 +102,46 @@ def extract_entity_names(data: dict, target_id: str, paranames_cantonese: Dict[s
         'cantonese_source': 'none'  # Track whether Cantonese name came from WikiData or ParaNames
     }
     
-    for item in data.get('@graph', []):
-        item_id = item.get('@id', '')
-        
-        # Look for the target entity (can be with or without @type)
-        if item_id == f'wd:{target_id}':
+    # Aliases for the dicts filled in the loop
+    cantonese = names['cantonese']
+    description_cantonese = names['description_cantonese']
+    
+    for item in nodes:
+        # Extract labels
+        if 'label' in item:
+            labels = item['label']
+            if isinstance(labels, dict):
+                labels = [labels]
             
-            # Extract labels
-            if 'label' in item:
-                labels = item.get('label', [])
-                if isinstance(labels, dict):
-                    labels = [labels]
-                
-                for label in labels:
-                    if isinstance(label, dict):
-                        lang = label.get('@language', '')
-                        value = label.get('@value', '')
-                        
-                        if lang == 'en':
-                            names['english'] = value
-                        elif lang in ['yue', 'zh-hk']:
-                            names['cantonese'][lang] = value
-                            names['cantonese_source'] = 'wikidata'
+            for label in labels:
+                if isinstance(label, dict):
+                    lang = label.get('@language', '')
+                    
+                    if lang == 'en':
+                        names['english'] = label.get('@value', '')
+                    elif lang == 'yue' or lang == 'zh-hk':
+                        cantonese[lang] = label.get('@value', '')
+                        names['cantonese_source'] = 'wikidata'
+        
+        # Extract descriptions
+        if 'description' in item:
+            descriptions = item['description']
+            if isinstance(descriptions, dict):
+                descriptions = [descriptions]
             
-            # Extract descriptions
-            if 'description' in item:
-                descriptions = item.get('description', [])
-                if isinstance(descriptions, dict):
-                    descriptions = [descriptions]
-                
-                for desc in descriptions:
-                    if isinstance(desc, dict):
-                        lang = desc.get('@language', '')
-                        value = desc.get('@value', '')
-                        
-                        if lang == 'en':
-                            names['description_english'] = value
-                        elif lang in ['yue', 'zh-hk']:
-                            names['description_cantonese'][lang] = value
-
-    # If no Cantonese names found in WikiData, check ParaNames dataset
-    if not names['cantonese'] and paranames_cantonese and target_id in paranames_cantonese:
-        names['cantonese'] = paranames_cantonese[target_id].copy()
+            for desc in descriptions:
+                if isinstance(desc, dict):
+                    lang = desc.get('@language', '')
+                    
+                    if lang == 'en':
+                        names['description_english'] = desc.get('@value', '')
+                    elif lang == 'yue' or lang == 'zh-hk':
+                        description_cantonese[lang] = desc.get('@value', '')
+
+    # If no Cantonese names found in WikiData, check ParaNames dataset; the
+    # ParaNames entry is shared rather than copied as names are only read
+    if not cantonese and paranames_cantonese and target_id in paranames_cantonese:
+        names['cantonese'] = paranames_cantonese[target_id]
         names['cantonese_source'] = 'paranames'
     
     # Set best Cantonese name
@@ -90,14 +154,17 @@ def load_jsonld_file(jsonld_file_path: str) -> dict:
     """
     Load and parse a JSONLD file.
     
+    The raw bytes are handed to orjson, which decodes UTF-8 and parses in
+    native code instead of going through a text-mode file and json.load.
+    
     Args:
         jsonld_file_path: Path to the JSONLD file
         
     Returns:
         Parsed JSON data
     """
-    with open(jsonld_file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(jsonld_file_path, 'rb') as f:
+        return orjson.loads(f.read())
 
 
 def extract_property_value(data: dict, target_id: str, property_id: str) -> Optional[str]:
@@ -112,11 +179,10 @@ def extract_property_value(data: dict, target_id: str, property_id: str) -> Opti
     Returns:
         Property value if found, None otherwise
     """
+    target = f'wd:{target_id}'
     for item in data.get('@graph', []):
-        item_id = item.get('@id', '')
-        
         # Look for the target entity
-        if item_id == f'wd:{target_id}' and property_id in item:
+        if property_id in item and item.get('@id') == target:
             return item.get(property_id)
     
     return None
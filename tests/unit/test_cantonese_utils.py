@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src/cleva/cantonese/utils/cantonese_utils.py
+
+Tests the ParaNames loader:
+- load_paranames_cantonese TSV parsing
+- load_paranames_cantonese subset cache
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from cleva.cantonese.utils import cantonese_utils
+from cleva.cantonese.utils.cantonese_utils import load_paranames_cantonese
+
+
+def write_tsv(file_path, rows):
+    """Write rows as a tab-separated file."""
+    with open(file_path, 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write('\t'.join(row) + '\n')
+
+
+class TestLoadParanamesColumns(unittest.TestCase):
+    """Test how load_paranames_cantonese reads the TSV columns."""
+    
+    def setUp(self):
+        """Create a temporary directory for the TSV."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tsv_path = os.path.join(self.temp_dir.name, 'paranames.tsv')
+    
+    def tearDown(self):
+        """Remove the temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_missing_column_warns_and_returns_empty(self):
+        """Test a header without the label column prints a warning and loads nothing."""
+        write_tsv(self.tsv_path, [
+            ['wikidata_id', 'eng', 'language'],
+            ['Q1', 'Player One', 'yue']
+        ])
+        
+        with patch('builtins.print') as mock_print:
+            names = load_paranames_cantonese(self.tsv_path)
+        
+        self.assertEqual(names, {})
+        printed = [str(c.args[0]) for c in mock_print.call_args_list]
+        self.assertTrue(any('Warning' in line and 'label' in line for line in printed))
+    
+    def test_empty_file_warns_and_returns_empty(self):
+        """Test a file without a header row loads nothing."""
+        write_tsv(self.tsv_path, [])
+        
+        with patch('builtins.print'):
+            self.assertEqual(load_paranames_cantonese(self.tsv_path), {})
+    
+    def test_short_and_blank_rows_skipped(self):
+        """Test rows missing the needed columns and blank lines are skipped."""
+        with open(self.tsv_path, 'w', encoding='utf-8') as f:
+            f.write('wikidata_id\teng\tlabel\tlanguage\n')
+            f.write('Q1\tPlayer One\t球員一\tyue\n')
+            f.write('\n')
+            f.write('Q2\tPlayer Two\t球員二\n')
+            f.write('Q3\n')
+            f.write('Q4\tPlayer Four\t球員四\tzh-hk\n')
+            f.write('\tNo Id\t無名\tyue\n')
+            f.write('Q5\tNo Label\t\tyue\n')
+        
+        names = load_paranames_cantonese(self.tsv_path)
+        
+        self.assertEqual(names, {
+            'Q1': {'yue': '球員一'},
+            'Q4': {'zh-hk': '球員四'}
+        })
+    
+    def test_reordered_columns(self):
+        """Test columns are found by header name, not position."""
+        write_tsv(self.tsv_path, [
+            ['language', 'label', 'type', 'wikidata_id'],
+            ['yue', ' 球員一 ', 'PER', 'Q1'],
+            ['zh-hk', '球員壹', 'PER', 'Q1'],
+            ['en', 'Player Two', 'PER', 'Q2'],
+            ['zh-hk', '球員三', 'PER', 'Q3']
+        ])
+        
+        names = load_paranames_cantonese(self.tsv_path)
+        
+        self.assertEqual(names, {
+            'Q1': {'yue': '球員一', 'zh-hk': '球員壹'},
+            'Q3': {'zh-hk': '球員三'}
+        })
+
+
+class TestLoadParanamesSubsetCache(unittest.TestCase):
+    """Test the subset cache of load_paranames_cantonese."""
+    
+    def setUp(self):
+        """Create a temporary ParaNames TSV."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tsv_path = os.path.join(self.temp_dir.name, 'paranames.tsv')
+        self.cache_path = os.path.join(self.temp_dir.name, 'cache', 'subset.json')
+        write_tsv(self.tsv_path, [
+            ['wikidata_id', 'eng', 'label', 'language', 'type'],
+            ['Q1', 'Player One', '球員一', 'yue', 'PER'],
+            ['Q1', 'Player One', '球員壹', 'zh-hk', 'PER'],
+            ['Q2', 'Player Two', 'Player Two', 'en', 'PER']
+        ])
+    
+    def tearDown(self):
+        """Remove the temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_cache_miss_writes_cache(self):
+        """Test the first load parses the TSV and writes the subset cache."""
+        names = load_paranames_cantonese(self.tsv_path, self.cache_path)
+        
+        self.assertEqual(names, {'Q1': {'yue': '球員一', 'zh-hk': '球員壹'}})
+        self.assertTrue(os.path.exists(self.cache_path))
+        with open(self.cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        tsv_stat = os.stat(self.tsv_path)
+        self.assertEqual(cached['tsv_stamp'], [tsv_stat.st_mtime_ns, tsv_stat.st_size])
+        self.assertEqual(cached['names'], names)
+    
+    def test_cache_hit_skips_tsv(self):
+        """Test a second load reads the cache without parsing the TSV."""
+        first = load_paranames_cantonese(self.tsv_path, self.cache_path)
+        
+        with patch.object(cantonese_utils.csv, 'reader') as mock_reader:
+            second = load_paranames_cantonese(self.tsv_path, self.cache_path)
+        
+        mock_reader.assert_not_called()
+        self.assertEqual(second, first)
+    
+    def test_cache_invalidated_when_tsv_changes(self):
+        """Test a changed TSV is parsed again, even if its mtime goes backwards."""
+        load_paranames_cantonese(self.tsv_path, self.cache_path)
+        old_stat = os.stat(self.tsv_path)
+        
+        write_tsv(self.tsv_path, [
+            ['wikidata_id', 'eng', 'label', 'language', 'type'],
+            ['Q3', 'Player Three', '球員三', 'yue', 'PER']
+        ])
+        # Restored from an older copy: the TSV is now older than the cache
+        os.utime(self.tsv_path, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns - 10**9))
+        
+        names = load_paranames_cantonese(self.tsv_path, self.cache_path)
+        
+        self.assertEqual(names, {'Q3': {'yue': '球員三'}})
+        with open(self.cache_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['names'], names)
+    
+    def test_unreadable_cache_is_rebuilt(self):
+        """Test a truncated or older-format cache is treated as a miss."""
+        os.makedirs(os.path.dirname(self.cache_path))
+        for contents in ('{"tsv_stamp": [1, ', '{"Q9": {"yue": "舊"}}'):
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                f.write(contents)
+            
+            names = load_paranames_cantonese(self.tsv_path, self.cache_path)
+            
+            self.assertEqual(names, {'Q1': {'yue': '球員一', 'zh-hk': '球員壹'}})
+
+
+if __name__ == '__main__':
+    unittest.main()
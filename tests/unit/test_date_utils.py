@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src/cleva/cantonese/utils/date_utils.py
+
+Tests parse_date and its year cache.
+"""
+
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from cleva.cantonese.utils import date_utils
+from cleva.cantonese.utils.date_utils import parse_date
+
+
+class TestParseDate(unittest.TestCase):
+    """Test the parse_date function."""
+    
+    def setUp(self):
+        """Start each test with an empty year cache."""
+        self.saved_cache = dict(date_utils._YEAR_CACHE)
+        date_utils._YEAR_CACHE.clear()
+    
+    def tearDown(self):
+        """Restore the year cache."""
+        date_utils._YEAR_CACHE.clear()
+        date_utils._YEAR_CACHE.update(self.saved_cache)
+    
+    def test_parse_date_year(self):
+        """Test the year is read from the first four characters."""
+        self.assertEqual(parse_date('2015-07-01T00:00:00Z'), 2015)
+        self.assertEqual(parse_date('1999'), 1999)
+    
+    def test_parse_date_repeated_string(self):
+        """Test a repeated date string returns the same year from the cache."""
+        date_str = '2010-01-01T00:00:00Z'
+        
+        self.assertEqual(parse_date(date_str), 2010)
+        self.assertEqual(date_utils._YEAR_CACHE, {date_str: 2010})
+        self.assertEqual(parse_date(date_str), 2010)
+        self.assertEqual(len(date_utils._YEAR_CACHE), 1)
+    
+    def test_parse_date_non_string(self):
+        """Test non-string input returns None and is not cached."""
+        for value in (None, 2015, 2015.0, ['2015'], b'2015-01-01'):
+            self.assertIsNone(parse_date(value))
+        self.assertEqual(date_utils._YEAR_CACHE, {})
+    
+    def test_parse_date_short_string(self):
+        """Test strings shorter than four characters return None every time."""
+        for value in ('', '201', '99'):
+            self.assertIsNone(parse_date(value))
+            self.assertIsNone(parse_date(value))
+        self.assertEqual(date_utils._YEAR_CACHE, {})
+    
+    def test_parse_date_invalid_year_prefix(self):
+        """Test an invalid year prefix raises ValueError, as before caching."""
+        for value in ('abcd-01-01', 'unknown', '20x5-01-01'):
+            with self.assertRaises(ValueError):
+                parse_date(value)
+            # Failures are not cached, so a retry raises again
+            with self.assertRaises(ValueError):
+                parse_date(value)
+        self.assertEqual(date_utils._YEAR_CACHE, {})
+    
+    def test_parse_date_cache_cap(self):
+        """Test the cache stops growing at its maximum size but parsing continues."""
+        with patch.object(date_utils, '_YEAR_CACHE_MAX_SIZE', 3):
+            for year in range(2000, 2010):
+                self.assertEqual(parse_date(f'{year}-01-01T00:00:00Z'), year)
+        
+        self.assertEqual(len(date_utils._YEAR_CACHE), 3)
+        self.assertEqual(set(date_utils._YEAR_CACHE.values()), {2000, 2001, 2002})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,7 +15,7 @@ import json
 import os
 import sys
 import tempfile
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import patch, MagicMock
 from datetime import datetime
 
 # Add src directory to path
@@ -23,10 +23,14 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
 from cleva.cantonese.soccer.extract_all_clubs import (
     teams_overlap,
+    _years_overlap,
+    _overlapping_pairs,
     categorize_teams,
     extract_all_teams,
+    extract_all_teams_from_data,
     process_all_players,
     find_potential_teammates,
+    iter_potential_teammates,
     analyze_single_player
 )
 
@@ -95,6 +99,47 @@ class TestTeamsOverlap(unittest.TestCase):
         self.assertTrue(teams_overlap(team1, team2))
 
 
+class TestYearsOverlap(unittest.TestCase):
+    """Test the _years_overlap function."""
+    
+    def test_years_overlap(self):
+        """Test overlapping and disjoint year ranges."""
+        self.assertTrue(_years_overlap(2015, 2018, 2017, 2020))
+        self.assertTrue(_years_overlap(2010, 2015, 2015, 2020))
+        self.assertFalse(_years_overlap(2015, 2016, 2018, 2020))
+    
+    def test_years_overlap_missing_years(self):
+        """Test missing start years never overlap and missing end years are ongoing."""
+        self.assertFalse(_years_overlap(None, 2018, 2017, 2020))
+        self.assertTrue(_years_overlap(2010, None, 2024, None))
+
+
+class TestOverlappingPairs(unittest.TestCase):
+    """Test the _overlapping_pairs function."""
+    
+    def test_overlapping_pairs_matches_nested_loop_order(self):
+        """Test pairs are returned as (i, j) with i < j in nested-loop order."""
+        starts = [2015, 2017, 2010, 2019]
+        ends = [2018, 2020, 2012, 2025]
+        self.assertEqual(_overlapping_pairs(starts, ends), [(0, 1), (1, 3)])
+    
+    def test_overlapping_pairs_skips_unknown_start(self):
+        """Test memberships without a start year never overlap."""
+        starts = [None, 2015, 2016]
+        ends = [2025, 2020, 2025]
+        self.assertEqual(_overlapping_pairs(starts, ends), [(1, 2)])
+    
+    def test_overlapping_pairs_touching_years(self):
+        """Test periods sharing a single boundary year count as overlapping."""
+        self.assertEqual(_overlapping_pairs([2010, 2015], [2015, 2020]), [(0, 1)])
+    
+    def test_overlapping_pairs_end_before_start(self):
+        """Test memberships recorded with an end year before their start year."""
+        starts = [2010, 2012, 2011]
+        ends = [2015, 2009, 2013]
+        self.assertEqual(_overlapping_pairs(starts, ends), [(0, 2)])
+
+
 class TestCategorizeTeams(unittest.TestCase):
     """Test the categorize_teams function."""
     
@@ -218,15 +263,14 @@ class TestExtractAllTeams(unittest.TestCase):
             ]
         }
     
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('json.load')
-    @patch('cleva.cantonese.soccer.extract_all_clubs.extract_entity_names')
-    def test_extract_all_teams_basic(self, mock_extract_names, mock_json_load, mock_file):
+    @patch('cleva.cantonese.soccer.extract_all_clubs.load_jsonld_file')
+    @patch('cleva.cantonese.soccer.extract_all_clubs.extract_entity_names_from_index')
+    def test_extract_all_teams_basic(self, mock_extract_names, mock_load_jsonld):
         """Test basic team extraction functionality."""
-        mock_json_load.return_value = self.mock_jsonld_data
+        mock_load_jsonld.return_value = self.mock_jsonld_data
         
-        # Mock the extract_entity_names function
-        def mock_extract_side_effect(data, entity_id, paranames):
+        # Mock the extract_entity_names_from_index function
+        def mock_extract_side_effect(by_id, entity_id, paranames):
             if entity_id == 'Q107051':
                 return {
                     'english': 'Lionel Messi',
@@ -269,11 +313,37 @@ class TestExtractAllTeams(unittest.TestCase):
         self.assertEqual(len(result['former_clubs']), 1)  # Barcelona
         self.assertEqual(len(result['current_clubs']), 1)  # PSG
     
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('json.load')
-    def test_extract_all_teams_invalid_filename(self, mock_json_load, mock_file):
+    @patch('cleva.cantonese.soccer.extract_all_clubs.load_jsonld_file')
+    def test_extract_all_teams_names_from_graph(self, mock_load_jsonld):
+        """Test names are resolved from the JSONLD graph when no cache is given."""
+        mock_load_jsonld.return_value = self.mock_jsonld_data
+        
+        result = extract_all_teams('/fake/path/Q107051.jsonld')
+        
+        self.assertEqual(result['player_names']['english'], 'Lionel Messi')
+        self.assertEqual(result['player_names']['cantonese_best'], '美斯')
+        teams = {team['club_id']: team for team in result['all_affiliations']}
+        self.assertEqual(teams['Q5794']['name'], 'FC Barcelona')
+        self.assertEqual(teams['Q5794']['cantonese_name'], '巴塞羅那')
+        self.assertTrue(teams['Q5794']['has_cantonese'])
+        self.assertEqual(teams['Q10308']['name'], 'Paris Saint-Germain')
+        self.assertFalse(teams['Q10308']['has_cantonese'])
+    
+    def test_extract_all_teams_from_data(self):
+        """Test extraction from an already parsed document matches loading it from a file."""
+        with patch('cleva.cantonese.soccer.extract_all_clubs.load_jsonld_file',
+                   return_value=self.mock_jsonld_data):
+            expected = extract_all_teams('/fake/path/Q107051.jsonld')
+        
+        result = extract_all_teams_from_data(self.mock_jsonld_data, '/fake/path/Q107051.jsonld')
+        
+        self.assertEqual(result, expected)
+        self.assertEqual(result['player_id'], 'Q107051')
+    
+    @patch('cleva.cantonese.soccer.extract_all_clubs.load_jsonld_file')
+    def test_extract_all_teams_invalid_filename(self, mock_load_jsonld):
         """Test handling of invalid filename."""
-        mock_json_load.return_value = {'@graph': []}
+        mock_load_jsonld.return_value = {'@graph': []}
         
         result = extract_all_teams('/fake/path/invalid_file.json')
         
@@ -389,6 +459,152 @@ class TestProcessAllPlayers(unittest.TestCase):
         self.assertIn('Q107051', result['players'])
 
 
+    def test_process_all_players_parallel_matches_sequential(self):
+        """Test worker processes produce the same result as sequential processing."""
+        graph = [
+            {'@id': 'wd:Q1', 'label': [{'@language': 'en', '@value': 'Player One'},
+                                       {'@language': 'yue', '@value': '球員一'}]},
+            {'@type': 'wikibase:Statement', 'ps:P54': 'wd:Q10', 'P580': '2010-01-01T00:00:00Z'},
+            {'@id': 'wd:Q10', 'label': {'@language': 'en', '@value': 'Club Ten'}}
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for player_id in ['Q1', 'Q2', 'Q3']:
+                with open(os.path.join(tmp_dir, f'{player_id}.jsonld'), 'w', encoding='utf-8') as f:
+                    json.dump({'@graph': graph}, f)
+            with open(os.path.join(tmp_dir, 'broken.jsonld'), 'w', encoding='utf-8') as f:
+                f.write('{not json')
+            
+            sequential = process_all_players(tmp_dir)
+            parallel = process_all_players(tmp_dir, max_workers=2)
+        
+        self.assertEqual(len(parallel['players']), 3)
+        self.assertEqual(parallel['players'], sequential['players'])
+        self.assertEqual(parallel['club_to_players'], sequential['club_to_players'])
+
+    def test_process_all_players_parallel_matches_sequential_partial_labels(self):
+        """Test results do not depend on file order when only one file labels a team."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for number in range(1, 41):
+                graph = [
+                    {'@id': f'wd:Q{number}', 'label': {'@language': 'en', '@value': f'Player {number}'}},
+                    {'@type': 'wikibase:Statement', 'ps:P54': 'wd:Q9999', 'P580': '2010-01-01T00:00:00Z'}
+                ]
+                if number == 1:
+                    graph.append({'@id': 'wd:Q9999', 'label': {'@language': 'en', '@value': 'Club X'}})
+                with open(os.path.join(tmp_dir, f'Q{number}.jsonld'), 'w', encoding='utf-8') as f:
+                    json.dump({'@graph': graph}, f)
+
+            sequential = process_all_players(tmp_dir)
+            parallel = process_all_players(tmp_dir, max_workers=3)
+
+        self.assertEqual(parallel['players'], sequential['players'])
+        names = [player['all_affiliations'][0]['name'] for player in sequential['players'].values()]
+        self.assertEqual(names.count('Club X'), 1)
+        self.assertEqual(names.count('Unknown'), 39)
+
+    def test_process_all_players_results_cache(self):
+        """Test stored extraction results are reused until the player file changes."""
+        graph = [
+            {'@id': 'wd:Q1', 'label': {'@language': 'en', '@value': 'Player One'}},
+            {'@type': 'wikibase:Statement', 'ps:P54': 'wd:Q10', 'P580': '2010-01-01T00:00:00Z'},
+            {'@id': 'wd:Q10', 'label': {'@language': 'en', '@value': 'Club Ten'}}
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            players_dir = os.path.join(tmp_dir, 'players')
+            results_cache_dir = os.path.join(tmp_dir, 'results')
+            os.makedirs(players_dir)
+            for player_id in ['Q1', 'Q2']:
+                with open(os.path.join(players_dir, f'{player_id}.jsonld'), 'w', encoding='utf-8') as f:
+                    json.dump({'@graph': graph}, f)
+            
+            first = process_all_players(players_dir, results_cache_dir=results_cache_dir)
+            
+            with patch('cleva.cantonese.soccer.extract_all_clubs.extract_all_teams',
+                       wraps=extract_all_teams) as mock_extract_teams:
+                second = process_all_players(players_dir, results_cache_dir=results_cache_dir)
+                self.assertEqual(mock_extract_teams.call_count, 0)
+                
+                # A rewritten player file is extracted again
+                changed_file = os.path.join(players_dir, 'Q2.jsonld')
+                with open(changed_file, 'w', encoding='utf-8') as f:
+                    json.dump({'@graph': graph[:1]}, f)
+                os.utime(changed_file, ns=(0, 0))
+                third = process_all_players(players_dir, results_cache_dir=results_cache_dir)
+                self.assertEqual(mock_extract_teams.call_count, 1)
+        
+        self.assertEqual(second['players'], first['players'])
+        self.assertEqual(third['players']['Q1'], first['players']['Q1'])
+        self.assertEqual(third['players']['Q2']['clubs'], [])
+    
+    def test_process_all_players_results_cache_invalidation(self):
+        """Test stored results are dropped after code changes and when unreadable."""
+        graph = [
+            {'@id': 'wd:Q1', 'label': {'@language': 'en', '@value': 'Player One'}},
+            {'@type': 'wikibase:Statement', 'ps:P54': 'wd:Q10', 'P580': '2010-01-01T00:00:00Z'},
+            {'@id': 'wd:Q10', 'label': {'@language': 'en', '@value': 'Club Ten'}}
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            players_dir = os.path.join(tmp_dir, 'players')
+            results_cache_dir = os.path.join(tmp_dir, 'results')
+            os.makedirs(players_dir)
+            for player_id in ['Q1', 'Q2']:
+                with open(os.path.join(players_dir, f'{player_id}.jsonld'), 'w', encoding='utf-8') as f:
+                    json.dump({'@graph': graph}, f)
+            
+            first = process_all_players(players_dir, results_cache_dir=results_cache_dir)
+            self.assertEqual(sorted(os.listdir(results_cache_dir)), ['Q1.jsonld.pickle', 'Q2.jsonld.pickle'])
+            
+            with patch('cleva.cantonese.soccer.extract_all_clubs.extract_all_teams',
+                       wraps=extract_all_teams) as mock_extract_teams:
+                # A truncated or stale entry is extracted again instead of failing the run
+                with open(os.path.join(results_cache_dir, 'Q1.jsonld.pickle'), 'wb') as f:
+                    f.write(b'\x80\x04garbage')
+                second = process_all_players(players_dir, results_cache_dir=results_cache_dir)
+                self.assertEqual(mock_extract_teams.call_count, 1)
+                
+                # Changed extraction code invalidates every stored result
+                with patch('cleva.cantonese.soccer.extract_all_clubs._extraction_code_stamp',
+                           return_value='changed'):
+                    third = process_all_players(players_dir, results_cache_dir=results_cache_dir)
+                self.assertEqual(mock_extract_teams.call_count, 3)
+            
+            self.assertEqual(sorted(os.listdir(results_cache_dir)), ['Q1.jsonld.pickle', 'Q2.jsonld.pickle'])
+        
+        self.assertEqual(second['players'], first['players'])
+        self.assertEqual(third['players'], first['players'])
+
+    def test_process_all_players_results_cache_other_file_changed(self):
+        """Test a stored result does not depend on other player files."""
+        def write_player(players_dir, player_id, club_label=None):
+            graph = [
+                {'@id': f'wd:{player_id}', 'label': {'@language': 'en', '@value': player_id}},
+                {'@type': 'wikibase:Statement', 'ps:P54': 'wd:Q10', 'P580': '2010-01-01T00:00:00Z'}
+            ]
+            if club_label:
+                graph.append({'@id': 'wd:Q10', 'label': {'@language': 'en', '@value': club_label}})
+            with open(os.path.join(players_dir, f'{player_id}.jsonld'), 'w', encoding='utf-8') as f:
+                json.dump({'@graph': graph}, f)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            players_dir = os.path.join(tmp_dir, 'players')
+            results_cache_dir = os.path.join(tmp_dir, 'results')
+            os.makedirs(players_dir)
+            # Only Q1 carries the club's label
+            write_player(players_dir, 'Q1', 'Club Ten')
+            write_player(players_dir, 'Q2')
+            process_all_players(players_dir, results_cache_dir=results_cache_dir)
+
+            # Renaming the club in Q1 must not leave Q2's stored result stale
+            write_player(players_dir, 'Q1', 'Club Ten Renamed')
+            os.utime(os.path.join(players_dir, 'Q1.jsonld'), ns=(0, 0))
+            warm = process_all_players(players_dir, results_cache_dir=results_cache_dir)
+            cold = process_all_players(players_dir)
+
+        self.assertEqual(warm['players'], cold['players'])
+        self.assertEqual(warm['club_to_players'], cold['club_to_players'])
+        self.assertEqual(cold['players']['Q2']['all_affiliations'][0]['name'], 'Unknown')
+
+
 class TestFindPotentialTeammates(unittest.TestCase):
     """Test the find_potential_teammates function."""
     
@@ -444,6 +660,8 @@ class TestFindPotentialTeammates(unittest.TestCase):
         self.assertIn('national_teammates', result)
         self.assertEqual(len(result['club_teammates']), 1)
         self.assertEqual(len(result['national_teammates']), 0)
+        self.assertEqual(result['club_pairs_with_cantonese'], 1)
+        self.assertEqual(result['national_pairs_with_cantonese'], 0)
         
         # Verify teammate structure
         teammate_pair = result['club_teammates'][0]
@@ -502,6 +720,40 @@ class TestFindPotentialTeammates(unittest.TestCase):
         # Should find no teammates due to no overlap
         self.assertEqual(len(result['club_teammates']), 0)
         self.assertEqual(len(result['national_teammates']), 0)
+    
+    def test_iter_potential_teammates_streams_records(self):
+        """Test the generator yields club pairs before national team pairs."""
+        def player(name, club_years, national_years):
+            return {
+                'player_names': {'english': name, 'cantonese_best': name, 'cantonese_lang': 'yue'},
+                'clubs': [{
+                    'club_id': 'Q5794', 'name': 'FC Barcelona', 'cantonese_name': '巴塞羅那',
+                    'has_cantonese': True, 'start_year': club_years[0], 'end_year': club_years[1],
+                    'is_current': False
+                }],
+                'national_teams': [{
+                    'club_id': 'Q79800', 'name': 'Argentina national football team',
+                    'cantonese_name': 'Unknown', 'has_cantonese': False,
+                    'start_year': national_years[0], 'end_year': national_years[1], 'is_current': False
+                }]
+            }
+        
+        mock_data = {
+            'players': {
+                'Q1': player('A', (2004, 2021), (2005, 2022)),
+                'Q2': player('B', (1998, 2015), (2006, 2010))
+            }
+        }
+        
+        records = iter_potential_teammates(mock_data)
+        self.assertFalse(isinstance(records, list))
+        records = list(records)
+        
+        self.assertEqual([record['team']['type'] for record in records], ['club', 'national_team'])
+        self.assertEqual(records[0]['player1']['id'], 'Q1')
+        self.assertEqual(records[0]['player2']['id'], 'Q2')
+        result = find_potential_teammates(mock_data)
+        self.assertEqual(result['club_teammates'] + result['national_teammates'], records)
 
 
 class TestAnalyzeSinglePlayer(unittest.TestCase):
@@ -536,6 +788,32 @@ class TestAnalyzeSinglePlayer(unittest.TestCase):
         # Verify that print was called (indicating output was generated)
         self.assertTrue(mock_print.called)
     
+    @patch('cleva.cantonese.soccer.extract_all_clubs.load_jsonld_file')
+    @patch('builtins.print')
+    def test_analyze_single_player_former_clubs(self, mock_print, mock_load_jsonld):
+        """Test former clubs are listed most recent first from a real extraction."""
+        mock_load_jsonld.return_value = {
+            '@graph': [
+                {'@id': 'wd:Q1', 'label': {'@language': 'en', '@value': 'Player One'}},
+                {'@type': 'wikibase:Statement', 'ps:P54': 'wd:Q10',
+                 'P580': '2005-01-01T00:00:00Z', 'P582': '2010-01-01T00:00:00Z'},
+                {'@type': 'wikibase:Statement', 'ps:P54': 'wd:Q20',
+                 'P580': '2010-01-01T00:00:00Z', 'P582': '2015-01-01T00:00:00Z'},
+                {'@type': 'wikibase:Statement', 'ps:P54': 'wd:Q30'},
+                {'@id': 'wd:Q10', 'label': {'@language': 'en', '@value': 'Club Ten FC'}},
+                {'@id': 'wd:Q20', 'label': {'@language': 'en', '@value': 'Club Twenty FC'}},
+                {'@id': 'wd:Q30', 'label': {'@language': 'en', '@value': 'Club Thirty FC'}}
+            ]
+        }
+
+        analyze_single_player('/fake/path/Q1.jsonld')
+
+        lines = [call.args[0] for call in mock_print.call_args_list if call.args]
+        self.assertFalse(any(line.startswith('Error processing file') for line in lines))
+        former = [line for line in lines if line.startswith('  • ')]
+        self.assertEqual(former, ['  • Club Twenty FC (Q20) - 2010-2015', '  • Club Ten FC (Q10) - 2005-2010'])
+        self.assertIn('  ✓ Club Thirty FC (Q30) - ? to present', lines)
+
     @patch('cleva.cantonese.soccer.extract_all_clubs.extract_all_teams')
     @patch('builtins.print')
     def test_analyze_single_player_with_error(self, mock_print, mock_extract_teams):
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Unit tests for src/cleva/cantonese/utils/file_utils.py
+
+Tests the output writer:
+- write_json
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from cleva.cantonese.utils.file_utils import write_json
+
+
+class TestWriteJson(unittest.TestCase):
+    """Test the write_json function."""
+    
+    def setUp(self):
+        """Create a temporary output directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_path = os.path.join(self.temp_dir.name, 'output.json')
+    
+    def tearDown(self):
+        """Remove the temporary output directory."""
+        self.temp_dir.cleanup()
+    
+    def assert_matches_json_dumps(self, data):
+        """Assert write_json produces exactly the bytes of json.dumps(indent=2)."""
+        write_json(self.output_path, data)
+        with open(self.output_path, 'rb') as f:
+            written = f.read()
+        expected = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        self.assertEqual(written, expected)
+    
+    def test_write_json_nested_dict(self):
+        """Test nested dicts and lists at several depths."""
+        self.assert_matches_json_dumps({
+            'players': {
+                'Q1': {'name': 'Player One', 'teams': ['A', 'B'], 'birth_year': 1990},
+                'Q2': {'name': 'Player Two', 'teams': [], 'birth_year': None}
+            },
+            'pairs': [['Q1', 'Q2', {'team': 'A', 'overlap': [2010, 2012]}]],
+            'count': 2,
+            'ratio': 0.5,
+            'complete': True
+        })
+    
+    def test_write_json_top_level_list(self):
+        """Test a list at the top level."""
+        self.assert_matches_json_dumps([{'a': 1}, [1, [2, [3]]], 'text', None])
+    
+    def test_write_json_empty_containers(self):
+        """Test empty dicts and lists, at the top level and nested."""
+        self.assert_matches_json_dumps({})
+        self.assert_matches_json_dumps([])
+        self.assert_matches_json_dumps({'empty_dict': {}, 'empty_list': [], 'nested': {'x': [{}]}})
+    
+    def test_write_json_non_ascii(self):
+        """Test non-ASCII text is written as UTF-8, not escaped."""
+        self.assert_matches_json_dumps({
+            '球員': {'name': '朗拿度', 'label': 'Cristiano Ronaldo'},
+            'teams': ['曼聯', 'Málaga', 'Beşiktaş']
+        })
+    
+    def test_write_json_quotes_and_newlines(self):
+        """Test strings containing quotes, backslashes, newlines and tabs."""
+        self.assert_matches_json_dumps({
+            'quote "key"': 'He said "hi"',
+            'multiline': 'line one\nline two\r\nline three',
+            'escapes': ['back\\slash', 'tab\there', '\n'],
+            'nested': {'text': '{\n  "not": "json"\n}'}
+        })
+    
+    def test_write_json_floats(self):
+        """Test floats keep the layout and values even where their spelling differs."""
+        data = {'ratio': 0.5, 'values': [1e16, 2.5e-05, 100.0, -0.1]}
+        write_json(self.output_path, data)
+        with open(self.output_path, 'r', encoding='utf-8') as f:
+            written = f.read()
+        
+        self.assertEqual(json.loads(written), data)
+        self.assertEqual(written.count('\n'), json.dumps(data, indent=2).count('\n'))
+        self.assertIn('1e16', written)
+    
+    def test_write_json_serialization_error_keeps_target(self):
+        """Test a failed write removes the temp file and leaves the old output."""
+        with open(self.output_path, 'w', encoding='utf-8') as f:
+            f.write('previous output')
+        
+        with self.assertRaises(TypeError):
+            write_json(self.output_path, {'ok': 1, 'bad': object()})
+        
+        with open(self.output_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), 'previous output')
+        self.assertFalse(os.path.exists(self.output_path + '.tmp'))
+        self.assertEqual(os.listdir(self.temp_dir.name), ['output.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()